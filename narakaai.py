@@ -16,14 +16,19 @@ import sys
 import os
 from pathlib import Path
 
-# Load environment variables from .env file
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent / ".env")
-
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.presentation.cli import main
 
-if __name__ == "__main__":
+def _run() -> None:
+    """Load the environment and hand off to the CLI."""
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent / ".env")
+
+    from src.presentation.cli import main
     main()
+
+
+if __name__ == "__main__":
+    _run()
@@ -1,11 +1,36 @@
 """Plugin system for Robin extensibility."""
 
-from .loader import PluginLoader, PluginManager
-from .base import BasePlugin, PluginMetadata
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = [
+if TYPE_CHECKING:
+    from .loader import PluginLoader, PluginManager
+    from .base import BasePlugin, PluginMetadata
+
+# Maps public names to the submodule that defines them
+_LAZY = {
+    "PluginLoader": ".loader",
+    "PluginManager": ".loader",
+    "BasePlugin": ".base",
+    "PluginMetadata": ".base",
+}
+
+__all__ = (
     "PluginLoader",
     "PluginManager",
     "BasePlugin",
     "PluginMetadata",
-]
+)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
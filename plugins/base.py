@@ -1,20 +1,68 @@
 """Base plugin class and metadata."""
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PluginMetadata:
-    """Plugin metadata."""
+    """Plugin metadata. Immutable and hashable."""
     name: str
     version: str
     description: str
     author: str
     plugin_type: str  # "search_engine", "llm_provider", "exporter", "analyzer"
-    dependencies: List[str] = field(default_factory=list)
-    config_schema: Optional[Dict[str, Any]] = None
+    dependencies: Tuple[str, ...] = ()
+    config_schema: Optional[Dict[str, Any]] = field(default=None, hash=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "author": self.author,
+            "plugin_type": self.plugin_type,
+            "dependencies": list(self.dependencies),
+            "config_schema": self.config_schema,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PluginMetadata":
+        """Create PluginMetadata from a dictionary."""
+        return cls(
+            name=data["name"],
+            version=data["version"],
+            description=data["description"],
+            author=data["author"],
+            plugin_type=data["plugin_type"],
+            dependencies=tuple(data.get("dependencies", ())),
+            config_schema=data.get("config_schema"),
+        )
+
+
+def _to_json_schema(config_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate a plugin config schema into JSON Schema.
+    
+    Plugins may either supply a JSON Schema directly or the shorthand
+    field map used by the bundled plugins, e.g.
+    ``{"timeout": {"type": "integer", "required": True}}``.
+    """
+    if isinstance(config_schema.get("type"), str) or "properties" in config_schema:
+        return config_schema
+    
+    properties = {}
+    required = []
+    for key, spec in config_schema.items():
+        spec = dict(spec)
+        if spec.pop("required", False):
+            required.append(key)
+        properties[key] = spec
+    
+    return {"type": "object", "properties": properties, "required": required}
 
 
 class BasePlugin(ABC):
@@ -22,13 +70,15 @@ class BasePlugin(ABC):
     Base class for all Robin plugins.
     
     All plugins must inherit from this class and implement
-    the required methods.
+    the required methods. A plugin module should export its
+    plugin class as ``Plugin = MyPlugin`` so the loader can
+    find it without scanning the module.
     """
     
-    @property
+    @classmethod
     @abstractmethod
-    def metadata(self) -> PluginMetadata:
-        """Return plugin metadata."""
+    def metadata(cls) -> PluginMetadata:
+        """Return plugin metadata. Must not depend on instance state."""
         pass
     
     @abstractmethod
@@ -46,6 +96,48 @@ class BasePlugin(ABC):
         """Clean up plugin resources."""
         pass
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _config_validator(cls):
+        """
+        Compile the config schema validator once per plugin class.
+        
+        Returns:
+            A jsonschema validator, or None if the plugin has no schema
+            or jsonschema is not installed
+        """
+        config_schema = cls.metadata().config_schema
+        if not config_schema:
+            return None
+        
+        try:
+            from jsonschema import Draft202012Validator
+        except ImportError:
+            return None
+        
+        schema = _to_json_schema(config_schema)
+        Draft202012Validator.check_schema(schema)
+        return Draft202012Validator(schema)
+    
+    def validation_errors(self, config: Dict[str, Any]) -> List[str]:
+        """
+        Get config validation errors against the plugin's config schema.
+        
+        Args:
+            config: Configuration to validate
+            
+        Returns:
+            List of error messages, empty if the config is valid
+        """
+        validator = self._config_validator()
+        if validator is None:
+            return []
+        
+        return [
+            f"{error.json_path}: {error.message}"
+            for error in validator.iter_errors(config)
+        ]
+    
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """
         Validate plugin configuration.
@@ -56,7 +148,7 @@ class BasePlugin(ABC):
         Returns:
             True if valid, False otherwise
         """
-        return True
+        return not self.validation_errors(config)
     
     def health_check(self) -> bool:
         """
@@ -22,15 +22,15 @@ class ExampleSearchEngine(SearchEnginePlugin):
         self._session = None
         self._config = {}
     
-    @property
-    def metadata(self) -> PluginMetadata:
+    @classmethod
+    def metadata(cls) -> PluginMetadata:
         return PluginMetadata(
             name="example_search",
             version="1.0.0",
             description="Example search engine plugin for demonstration",
             author="Robin Team",
             plugin_type="search_engine",
-            dependencies=[],
+            dependencies=(),
             config_schema={
                 "api_key": {"type": "string", "required": False},
                 "timeout": {"type": "integer", "default": 30},
@@ -2,14 +2,30 @@
 
 import os
 import sys
+import json
+import functools
+import inspect
+import tempfile
 import importlib
 import importlib.util
-from typing import Dict, List, Optional, Type, Any
+from collections import defaultdict
+from typing import Dict, List, Optional, Type, Any, Tuple, Set
 from pathlib import Path
 import logging
 
 from .base import BasePlugin, PluginMetadata
 
+try:
+    from jsonschema.exceptions import SchemaError
+except ImportError:  # pragma: no cover - optional dependency
+    class SchemaError(Exception):
+        """Never raised: without jsonschema, config schemas aren't compiled."""
+
+
+# Manifest of plugin metadata persisted between runs
+MANIFEST_NAME = ".plugin_cache.json"
+MANIFEST_VERSION = 1
+
 
 class PluginLoader:
     """
@@ -20,6 +36,7 @@ class PluginLoader:
     
     def __init__(self, plugins_dir: str = "plugins"):
         self._plugins_dir = Path(plugins_dir)
+        self._manifest_path = self._plugins_dir / MANIFEST_NAME
         self._logger = logging.getLogger("robin.plugins")
     
     def discover_plugins(self) -> List[str]:
@@ -31,21 +48,93 @@ class PluginLoader:
         """
         plugins = []
         
-        if not self._plugins_dir.exists():
-            self._logger.warning(f"Plugins directory not found: {self._plugins_dir}")
+        try:
+            # DirEntry caches file type from the directory read, saving a stat per entry
+            with os.scandir(self._plugins_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("_"):
+                        continue
+                    
+                    # Check for single file plugins
+                    if name.endswith(".py") and entry.is_file():
+                        plugins.append(entry.path)
+                    
+                    # Check for package plugins
+                    elif entry.is_dir() and os.path.exists(os.path.join(entry.path, "__init__.py")):
+                        plugins.append(entry.path)
+        except FileNotFoundError:
+            self._logger.warning("Plugins directory not found: %s", self._plugins_dir)
             return plugins
         
-        for item in self._plugins_dir.iterdir():
-            # Check for single file plugins
-            if item.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
-                plugins.append(str(item))
+        self._logger.info("Discovered %d plugins", len(plugins))
+        return plugins
+    
+    def stat_signature(self, plugin_path: str) -> Tuple[int, int]:
+        """
+        Get a cheap change signature for a plugin.
+        
+        Args:
+            plugin_path: Path to plugin file or directory
             
-            # Check for package plugins
-            elif item.is_dir() and (item / "__init__.py").exists():
-                plugins.append(str(item))
+        Returns:
+            Tuple of (latest mtime in ns, total size in bytes)
+        """
+        path = Path(plugin_path)
         
-        self._logger.info(f"Discovered {len(plugins)} plugins")
-        return plugins
+        if path.is_file():
+            stat = path.stat()
+            return stat.st_mtime_ns, stat.st_size
+        
+        # Packages change when any of their modules change
+        mtime_ns, size = 0, 0
+        for module_file in path.rglob("*.py"):
+            stat = module_file.stat()
+            mtime_ns = max(mtime_ns, stat.st_mtime_ns)
+            size += stat.st_size
+        return mtime_ns, size
+    
+    def load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the cached plugin manifest.
+        
+        Returns:
+            Mapping of plugin path to its cached signature and metadata
+        """
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        
+        plugins = data.get("plugins")
+        return plugins if isinstance(plugins, dict) else {}
+    
+    def save_manifest(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Atomically write the plugin manifest.
+        
+        Args:
+            entries: Mapping of plugin path to its signature and metadata
+        """
+        data = {"version": MANIFEST_VERSION, "plugins": entries}
+        
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._plugins_dir, prefix=MANIFEST_NAME, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self._manifest_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self._logger.warning("Could not write plugin manifest: %s", e)
     
     def load_plugin(self, plugin_path: str) -> Optional[Type[BasePlugin]]:
         """
@@ -59,68 +148,87 @@ class PluginLoader:
         """
         path = Path(plugin_path)
         
+        if path.is_file():
+            load = self._load_file_plugin
+        elif path.is_dir():
+            load = self._load_package_plugin
+        else:
+            self._logger.error("Invalid plugin path: %s", plugin_path)
+            return None
+        
         try:
-            if path.is_file():
-                return self._load_file_plugin(path)
-            elif path.is_dir():
-                return self._load_package_plugin(path)
-            else:
-                self._logger.error(f"Invalid plugin path: {plugin_path}")
-                return None
-                
-        except Exception as e:
-            self._logger.error(f"Failed to load plugin {plugin_path}: {e}")
+            return load(path)
+        except (ImportError, SyntaxError, OSError):
+            # Broken or unreadable plugin code; skip it but keep the traceback
+            self._logger.error("Failed to load plugin %s", plugin_path, exc_info=True)
             return None
     
     def _load_file_plugin(self, path: Path) -> Optional[Type[BasePlugin]]:
         """Load a single-file plugin."""
-        module_name = f"plugins.{path.stem}"
-        
-        spec = importlib.util.spec_from_file_location(module_name, path)
-        if spec is None or spec.loader is None:
+        module = self._import_module(f"plugins.{path.stem}", path)
+        if module is None:
             return None
         
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        
-        # Find plugin class
-        for name in dir(module):
-            obj = getattr(module, name)
-            if (
-                isinstance(obj, type) and
-                issubclass(obj, BasePlugin) and
-                obj is not BasePlugin
-            ):
-                return obj
-        
-        return None
+        return self._find_plugin_class(module)
     
     def _load_package_plugin(self, path: Path) -> Optional[Type[BasePlugin]]:
         """Load a package plugin."""
-        module_name = f"plugins.{path.name}"
+        module = self._import_module(f"plugins.{path.name}", path / "__init__.py")
+        if module is None:
+            return None
+        
+        return self._find_plugin_class(module)
+    
+    def _import_module(self, module_name: str, file_path: Path) -> Optional[Any]:
+        """
+        Import a module from a file, reusing it if already imported.
         
-        init_file = path / "__init__.py"
-        spec = importlib.util.spec_from_file_location(module_name, init_file)
+        Re-executing a module that is already loaded would create new
+        class objects and break issubclass checks against the originals.
+        """
+        existing = sys.modules.get(module_name)
+        existing_file = getattr(existing, "__file__", None)
+        if existing_file and os.path.abspath(existing_file) == os.path.abspath(file_path):
+            return existing
         
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
         if spec is None or spec.loader is None:
             return None
         
         module = importlib.util.module_from_spec(spec)
         sys.modules[module_name] = module
-        spec.loader.exec_module(module)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Don't leave a half-initialized module behind
+            sys.modules.pop(module_name, None)
+            raise
+        
+        return module
+    
+    def _find_plugin_class(self, module: Any) -> Optional[Type[BasePlugin]]:
+        """Find the plugin class exported by a module."""
+        # Fast path: the module names its plugin class explicitly
+        plugin_class = getattr(module, "Plugin", None)
+        if self._is_plugin_class(plugin_class):
+            return plugin_class
         
-        # Find plugin class
+        # Fall back to scanning for a concrete BasePlugin subclass
         for name in dir(module):
             obj = getattr(module, name)
-            if (
-                isinstance(obj, type) and
-                issubclass(obj, BasePlugin) and
-                obj is not BasePlugin
-            ):
+            if self._is_plugin_class(obj) and not inspect.isabstract(obj):
                 return obj
         
         return None
+    
+    @staticmethod
+    def _is_plugin_class(obj: Any) -> bool:
+        """Check whether an object is a BasePlugin subclass."""
+        return (
+            isinstance(obj, type) and
+            issubclass(obj, BasePlugin) and
+            obj is not BasePlugin
+        )
 
 
 class PluginManager:
@@ -132,34 +240,80 @@ class PluginManager:
         self._loader = PluginLoader(plugins_dir)
         self._plugins: Dict[str, BasePlugin] = {}
         self._plugin_classes: Dict[str, Type[BasePlugin]] = {}
+        self._plugin_paths: Dict[str, str] = {}
+        self._metadata: Dict[str, PluginMetadata] = {}
+        # Names of initialized plugins, grouped by plugin type
+        self._by_type: Dict[str, Set[str]] = defaultdict(set)
         self._logger = logging.getLogger("robin.plugins.manager")
     
     def load_all(self) -> int:
         """
         Load all available plugins.
         
+        Plugins whose files are unchanged since the last run are
+        registered from the manifest and only imported when initialized.
+        
         Returns:
             Number of plugins loaded
         """
         plugin_paths = self._loader.discover_plugins()
+        manifest = self._loader.load_manifest()
+        entries: Dict[str, Dict[str, Any]] = {}
         loaded = 0
         
         for path in plugin_paths:
-            plugin_class = self._loader.load_plugin(path)
-            if plugin_class:
+            signature = list(self._loader.stat_signature(path))
+            entry = manifest.get(path)
+            metadata = None
+            
+            if isinstance(entry, dict) and entry.get("signature") == signature:
                 try:
-                    # Create instance to get metadata
-                    temp_instance = plugin_class.__new__(plugin_class)
-                    if hasattr(temp_instance, 'metadata'):
-                        metadata = temp_instance.metadata
-                        self._plugin_classes[metadata.name] = plugin_class
-                        loaded += 1
-                        self._logger.info(f"Loaded plugin: {metadata.name} v{metadata.version}")
-                except Exception as e:
-                    self._logger.error(f"Failed to register plugin: {e}")
+                    metadata = PluginMetadata.from_dict(entry["metadata"])
+                except (KeyError, TypeError, AttributeError):
+                    # A hand-edited or partly written entry; import the plugin instead
+                    self._logger.debug("Ignoring bad manifest entry for %s", path)
+            
+            if metadata is None:
+                plugin_class = self._loader.load_plugin(path)
+                if not plugin_class:
+                    continue
+                try:
+                    metadata = self._get_metadata(plugin_class)
+                except (TypeError, AttributeError):
+                    # metadata() missing, not a classmethod, or built incorrectly
+                    self._logger.error("Failed to register plugin %s", path, exc_info=True)
+                    continue
+                self._plugin_classes[metadata.name] = plugin_class
+                entry = {"signature": signature, "metadata": metadata.to_dict()}
+            
+            entries[path] = entry
+            self._plugin_paths[metadata.name] = path
+            self._metadata[metadata.name] = metadata
+            loaded += 1
+            self._logger.info("Loaded plugin: %s v%s", metadata.name, metadata.version)
+        
+        if entries != manifest:
+            self._loader.save_manifest(entries)
         
         return loaded
     
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_metadata(plugin_class: Type[BasePlugin]) -> PluginMetadata:
+        """Get a plugin class's metadata, cached per class."""
+        return plugin_class.metadata()
+    
+    def _get_plugin_class(self, name: str) -> Optional[Type[BasePlugin]]:
+        """Resolve a plugin class, importing it on first use."""
+        plugin_class = self._plugin_classes.get(name)
+        
+        if plugin_class is None and name in self._plugin_paths:
+            plugin_class = self._loader.load_plugin(self._plugin_paths[name])
+            if plugin_class:
+                self._plugin_classes[name] = plugin_class
+        
+        return plugin_class
+    
     def initialize_plugin(
         self,
         name: str,
@@ -175,24 +329,52 @@ class PluginManager:
         Returns:
             Initialized plugin instance or None
         """
-        if name not in self._plugin_classes:
-            self._logger.error(f"Plugin not found: {name}")
+        if name not in self._metadata:
+            self._logger.error("Plugin not found: %s", name)
             return None
         
         if name in self._plugins:
-            self._logger.warning(f"Plugin already initialized: {name}")
+            self._logger.warning("Plugin already initialized: %s", name)
             return self._plugins[name]
         
+        plugin_class = self._get_plugin_class(name)
+        if plugin_class is None:
+            self._logger.error("Failed to import plugin: %s", name)
+            return None
+        
+        config = config or {}
+        
         try:
-            plugin_class = self._plugin_classes[name]
             plugin = plugin_class()
-            plugin.initialize(config or {})
-            self._plugins[name] = plugin
-            self._logger.info(f"Initialized plugin: {name}")
-            return plugin
-        except Exception as e:
-            self._logger.error(f"Failed to initialize plugin {name}: {e}")
+        except TypeError:
+            # Plugins must be constructible without arguments
+            self._logger.error("Failed to instantiate plugin %s", name, exc_info=True)
             return None
+        
+        try:
+            valid = plugin.validate_config(config)
+        except SchemaError:
+            # The plugin's own config_schema is malformed
+            self._logger.error("Invalid config schema for plugin %s", name, exc_info=True)
+            return None
+        
+        if not valid:
+            errors = plugin.validation_errors(config) or ["configuration rejected"]
+            for error in errors:
+                self._logger.error("Invalid config for plugin %s: %s", name, error)
+            return None
+        
+        try:
+            plugin.initialize(config)
+        except Exception:
+            # initialize() runs third-party setup code (network, files, ...)
+            self._logger.error("Failed to initialize plugin %s", name, exc_info=True)
+            return None
+        
+        self._plugins[name] = plugin
+        self._by_type[self._metadata[name].plugin_type].add(name)
+        self._logger.info("Initialized plugin: %s", name)
+        return plugin
     
     def get_plugin(self, name: str) -> Optional[BasePlugin]:
         """Get an initialized plugin by name."""
@@ -200,17 +382,7 @@ class PluginManager:
     
     def list_plugins(self) -> List[PluginMetadata]:
         """List all available plugin metadata."""
-        metadata_list = []
-        
-        for name, plugin_class in self._plugin_classes.items():
-            try:
-                temp_instance = plugin_class.__new__(plugin_class)
-                if hasattr(temp_instance, 'metadata'):
-                    metadata_list.append(temp_instance.metadata)
-            except Exception:
-                pass
-        
-        return metadata_list
+        return list(self._metadata.values())
     
     def list_initialized(self) -> List[str]:
         """List names of initialized plugins."""
@@ -223,12 +395,15 @@ class PluginManager:
         
         try:
             self._plugins[name].shutdown()
-            del self._plugins[name]
-            self._logger.info(f"Shutdown plugin: {name}")
-            return True
-        except Exception as e:
-            self._logger.error(f"Failed to shutdown plugin {name}: {e}")
+        except Exception:
+            # shutdown() runs third-party cleanup code
+            self._logger.error("Failed to shutdown plugin %s", name, exc_info=True)
             return False
+        
+        del self._plugins[name]
+        self._by_type[self._metadata[name].plugin_type].discard(name)
+        self._logger.info("Shutdown plugin: %s", name)
+        return True
     
     def shutdown_all(self) -> None:
         """Shutdown all initialized plugins."""
@@ -237,10 +412,4 @@ class PluginManager:
     
     def get_plugins_by_type(self, plugin_type: str) -> List[BasePlugin]:
         """Get all initialized plugins of a specific type."""
-        plugins = []
-        
-        for plugin in self._plugins.values():
-            if plugin.metadata.plugin_type == plugin_type:
-                plugins.append(plugin)
-        
-        return plugins
+        return [self._plugins[name] for name in self._by_type.get(plugin_type, ())]
@@ -1,10 +1,20 @@
-"""Export service adapters."""
+"""Export service adapters.
 
-from .json_export import JSONExporter
-from .csv_export import CSVExporter
-from .stix_export import STIXExporter
-from .pdf_export import PDFExporter
-from .factory import get_exporter, list_exporters
+Exporter classes are imported on first access so that commands which
+never export (e.g. ``search``) don't pay for loading the PDF/STIX code.
+"""
+
+import importlib
+
+# Maps public names to the submodule that defines them
+_LAZY = {
+    "JSONExporter": ".json_export",
+    "CSVExporter": ".csv_export",
+    "STIXExporter": ".stix_export",
+    "PDFExporter": ".pdf_export",
+    "get_exporter": ".factory",
+    "list_exporters": ".factory",
+}
 
 __all__ = [
     "JSONExporter",
@@ -14,3 +24,16 @@ __all__ = [
     "get_exporter",
     "list_exporters",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,88 @@
+"""Common functionality shared by export adapters."""
+
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Tuple
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from ...infrastructure.files import WRITE_BUFFER_SIZE, atomic_write
+
+
+def dumps_json(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+    
+    Uses orjson when installed and falls back to the standard library.
+    Values neither encoder understands are serialized with ``str``.
+    
+    Args:
+        data: Data to serialize
+        indent: Indentation width, or None for compact output
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    # orjson only supports two-space indentation
+    if orjson is not None and indent in (None, 0, 2):
+        # Accept int/enum keys the same way json.dumps does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    
+    # Compact output uses the same separators as orjson
+    separators = None if indent else (",", ":")
+    return json.dumps(
+        data, indent=indent, separators=separators, default=str, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def write_json_document(
+    f: BinaryIO,
+    members: Iterable[Tuple[str, Any]],
+    indent: Optional[int] = None
+) -> None:
+    """
+    Write a JSON object to a binary file one member at a time.
+    
+    Member values that are iterators are written as arrays element by
+    element, so large record lists never have to exist in memory at
+    once. The output matches ``dumps_json`` of the equivalent dict.
+    
+    Args:
+        f: Binary file to write to
+        members: (key, value) pairs of the top-level object
+        indent: Indentation width, or None for compact output
+    """
+    write = f.write
+    pad = b"\n" + b" " * indent if indent else b""
+    inner_pad = pad + b" " * indent if indent else b""
+    key_sep = b": " if indent else b":"
+    
+    write(b"{")
+    for i, (key, value) in enumerate(members):
+        if i:
+            write(b",")
+        write(pad + dumps_json(key) + key_sep)
+        
+        if not isinstance(value, Iterator):
+            # JSON strings never contain raw newlines, so re-indenting is safe
+            write(dumps_json(value, indent).replace(b"\n", pad) if indent else dumps_json(value))
+            continue
+        
+        write(b"[")
+        empty = True
+        for element in value:
+            if not empty:
+                write(b",")
+            empty = False
+            encoded = dumps_json(element, indent)
+            write(inner_pad + encoded.replace(b"\n", inner_pad) if indent else encoded)
+        if not empty:
+            write(pad)
+        write(b"]")
+    
+    write(b"\n}" if indent else b"}")
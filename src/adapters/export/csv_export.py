@@ -4,10 +4,34 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 import csv
 import io
+import logging
+from operator import attrgetter
 from pathlib import Path
 
 from ...core.interfaces.export import ExportProvider
 from ...core.entities.investigation import Investigation
+from .base import WRITE_BUFFER_SIZE
+
+
+_logger = logging.getLogger("robin.export.csv")
+
+
+def _csv_field(value: Any) -> str:
+    """Format a value as a CSV field, quoting it like csv.writer would."""
+    text = "" if value is None else str(value)
+    if any(char in text for char in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _truncate(text: Optional[str], limit: int) -> str:
+    """Truncate text to a maximum length, marking cut text with an ellipsis."""
+    if not text:
+        return ""
+    # A one-character slice past the limit avoids measuring the whole text
+    if text[limit:limit + 1]:
+        return text[:limit] + "..."
+    return text
 
 
 class CSVExporter(ExportProvider):
@@ -37,38 +61,32 @@ class CSVExporter(ExportProvider):
         options: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Export investigation to CSV files."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        options = options or {}
+        output_base = Path(output_path).with_suffix("")
+        
+        tasks = [
+            (self._export_search_results, f"{output_base}_search_results.csv"),
+            (self._export_scraped_content, f"{output_base}_scraped_content.csv"),
+            (self._export_entities, f"{output_base}_entities.csv"),
+            (self._export_summary, f"{output_base}_summary.csv"),
+        ]
+        
         try:
-            options = options or {}
-            output_base = Path(output_path).with_suffix("")
-            
-            # Export search results
-            self._export_search_results(
-                investigation,
-                f"{output_base}_search_results.csv"
-            )
-            
-            # Export scraped content
-            self._export_scraped_content(
-                investigation,
-                f"{output_base}_scraped_content.csv"
-            )
-            
-            # Export entities
-            self._export_entities(
-                investigation,
-                f"{output_base}_entities.csv"
-            )
-            
-            # Export summary
-            self._export_summary(
-                investigation,
-                f"{output_base}_summary.csv"
-            )
-            
-            return True
-        except Exception as e:
-            print(f"Export failed: {e}")
+            # The files are independent, so write them concurrently
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    executor.submit(export_file, investigation, path)
+                    for export_file, path in tasks
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        except Exception:
+            _logger.exception("CSV export failed for %s", output_path)
             return False
+        
+        return True
     
     def export_bytes(
         self,
@@ -79,7 +97,9 @@ class CSVExporter(ExportProvider):
         options = options or {}
         data_type = options.get("data_type", "search_results")
         
-        output = io.StringIO()
+        # Encode rows as they are written rather than building a str first
+        buffer = io.BytesIO()
+        output = io.TextIOWrapper(buffer, encoding="utf-8", errors="replace", newline="")
         writer = csv.writer(output)
         
         if data_type == "search_results":
@@ -89,11 +109,13 @@ class CSVExporter(ExportProvider):
         elif data_type == "scraped_content":
             self._write_scraped_content(writer, investigation)
         
-        return output.getvalue().encode("utf-8")
+        output.flush()
+        output.detach()  # Keep the wrapper from closing the buffer
+        return buffer.getvalue()
     
     def _export_search_results(self, investigation: Investigation, path: str) -> None:
         """Export search results to CSV."""
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             self._write_search_results(writer, investigation)
     
@@ -104,22 +126,27 @@ class CSVExporter(ExportProvider):
             "Query", "Discovered At", "Relevance Score", "Is Scraped"
         ])
         
-        for result in investigation.search_results:
-            writer.writerow([
-                result.id,
-                result.url,
-                result.title,
-                result.description,
-                result.source_engine,
-                result.query,
-                result.discovered_at.isoformat() if result.discovered_at else "",
-                result.relevance_score,
-                result.is_scraped,
-            ])
+        writerows = writer.writerows
+        iso = datetime.isoformat
+        get_fields = attrgetter(
+            "id", "url", "title", "description", "source_engine", "query",
+            "discovered_at", "relevance_score", "is_scraped",
+        )
+        writerows(
+            (
+                result_id, url, title, description, source_engine, query,
+                iso(discovered_at) if discovered_at else "",
+                relevance_score, is_scraped,
+            )
+            for (
+                result_id, url, title, description, source_engine, query,
+                discovered_at, relevance_score, is_scraped,
+            ) in map(get_fields, investigation.search_results)
+        )
     
     def _export_scraped_content(self, investigation: Investigation, path: str) -> None:
         """Export scraped content to CSV."""
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             self._write_scraped_content(writer, investigation)
     
@@ -130,27 +157,28 @@ class CSVExporter(ExportProvider):
             "Status Code", "Content Type", "Language", "Content Length"
         ])
         
-        for content in investigation.scraped_content:
-            # Truncate text for CSV
-            clean_text = content.clean_text or ""
-            if len(clean_text) > 500:
-                clean_text = clean_text[:500] + "..."
-            
-            writer.writerow([
-                content.id,
-                content.url,
-                content.title,
-                clean_text,
-                content.scraped_at.isoformat() if content.scraped_at else "",
-                content.status_code,
-                content.content_type,
-                content.language,
-                content.content_length,
-            ])
+        writerows = writer.writerows
+        iso = datetime.isoformat
+        get_fields = attrgetter(
+            "id", "url", "title", "clean_text", "scraped_at",
+            "status_code", "content_type", "language", "content_length",
+        )
+        writerows(
+            (
+                content_id, url, title,
+                _truncate(clean_text, 500),  # Truncate text for CSV
+                iso(scraped_at) if scraped_at else "",
+                status_code, content_type, language, content_length,
+            )
+            for (
+                content_id, url, title, clean_text, scraped_at,
+                status_code, content_type, language, content_length,
+            ) in map(get_fields, investigation.scraped_content)
+        )
     
     def _export_entities(self, investigation: Investigation, path: str) -> None:
         """Export entities to CSV."""
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             self._write_entities(writer, investigation)
     
@@ -160,30 +188,41 @@ class CSVExporter(ExportProvider):
             "ID", "Type", "Value", "Confidence", "Context", "Source URL"
         ])
         
-        for entity in investigation.extracted_entities:
-            writer.writerow([
-                entity.id,
-                entity.entity_type,
-                entity.value,
-                entity.confidence,
-                entity.context[:200] if entity.context else "",
-                entity.source_url,
-            ])
+        writerows = writer.writerows
+        get_fields = attrgetter(
+            "id", "entity_type", "value", "confidence", "context", "source_url",
+        )
+        writerows(
+            (
+                entity_id, entity_type, value, confidence,
+                context[:200] if context else "",
+                source_url,
+            )
+            for (
+                entity_id, entity_type, value, confidence, context, source_url,
+            ) in map(get_fields, investigation.extracted_entities)
+        )
     
     def _export_summary(self, investigation: Investigation, path: str) -> None:
         """Export investigation summary to CSV."""
+        rows = [
+            ("Field", "Value"),
+            ("Investigation ID", investigation.id),
+            ("Query", investigation.query),
+            ("Status", investigation.status.value),
+            ("Created At", investigation.created_at.isoformat() if investigation.created_at else ""),
+            ("Updated At", investigation.updated_at.isoformat() if investigation.updated_at else ""),
+            ("Completed At", investigation.completed_at.isoformat() if investigation.completed_at else ""),
+            ("Search Results Count", len(investigation.search_results)),
+            ("Scraped Pages Count", len(investigation.scraped_content)),
+            ("Entities Count", len(investigation.extracted_entities)),
+            ("Tags", ", ".join(investigation.tags)),
+            ("Summary", investigation.summary or ""),
+        ]
+        
+        # Two columns and a dozen rows don't need the csv module
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            
-            writer.writerow(["Field", "Value"])
-            writer.writerow(["Investigation ID", investigation.id])
-            writer.writerow(["Query", investigation.query])
-            writer.writerow(["Status", investigation.status.value])
-            writer.writerow(["Created At", investigation.created_at.isoformat() if investigation.created_at else ""])
-            writer.writerow(["Updated At", investigation.updated_at.isoformat() if investigation.updated_at else ""])
-            writer.writerow(["Completed At", investigation.completed_at.isoformat() if investigation.completed_at else ""])
-            writer.writerow(["Search Results Count", len(investigation.search_results)])
-            writer.writerow(["Scraped Pages Count", len(investigation.scraped_content)])
-            writer.writerow(["Entities Count", len(investigation.extracted_entities)])
-            writer.writerow(["Tags", ", ".join(investigation.tags)])
-            writer.writerow(["Summary", investigation.summary or ""])
+            f.writelines(
+                f"{_csv_field(field)},{_csv_field(value)}\r\n"
+                for field, value in rows
+            )
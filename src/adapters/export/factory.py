@@ -17,23 +17,38 @@ EXPORTER_REGISTRY: Dict[str, Type[ExportProvider]] = {
     "pdf": PDFExporter,
 }
 
+# Shared exporter instances, keyed like EXPORTER_REGISTRY
+_INSTANCE_CACHE: Dict[str, ExportProvider] = {}
+
 
 def get_exporter(format_name: str) -> Optional[ExportProvider]:
     """
     Get an exporter instance by format name.
     
+    Exporters are stateless, so one instance per format is shared.
+    Exporter classes that hold per-export state can opt out by
+    setting a ``shareable = False`` class attribute.
+    
     Args:
         format_name: Name of the export format
         
     Returns:
         Exporter instance or None if format not found
     """
-    exporter_class = EXPORTER_REGISTRY.get(format_name.lower())
+    key = format_name if format_name.islower() else format_name.lower()
+    exporter_class = EXPORTER_REGISTRY.get(key)
     
-    if exporter_class:
+    if exporter_class is None:
+        return None
+    
+    if not getattr(exporter_class, "shareable", True):
         return exporter_class()
     
-    return None
+    exporter = _INSTANCE_CACHE.get(key)
+    if exporter is None:
+        exporter = _INSTANCE_CACHE[key] = exporter_class()
+    
+    return exporter
 
 
 def list_exporters() -> List[str]:
@@ -43,4 +58,6 @@ def list_exporters() -> List[str]:
 
 def register_exporter(format_name: str, exporter_class: Type[ExportProvider]) -> None:
     """Register a custom exporter."""
-    EXPORTER_REGISTRY[format_name.lower()] = exporter_class
+    key = format_name.lower()
+    EXPORTER_REGISTRY[key] = exporter_class
+    _INSTANCE_CACHE.pop(key, None)
@@ -1,19 +1,41 @@
 """JSON export adapter."""
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-import json
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple
+from datetime import datetime, timezone
 from pathlib import Path
+import io
+import logging
 
 from ...core.interfaces.export import ExportProvider
 from ...core.entities.investigation import Investigation
+from .base import atomic_write, write_json_document
+
+
+_logger = logging.getLogger("robin.export.json")
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601."""
+    return value.isoformat() if value else None
+
+
+def _with_raw_html(
+    records: Iterable[Dict[str, Any]],
+    sources: Iterable[Any]
+) -> Iterator[Dict[str, Any]]:
+    """Add each source's raw HTML, when present, to its record dict."""
+    for record, source in zip(records, sources):
+        if source.raw_html:
+            record["raw_html"] = source.raw_html
+        yield record
 
 
 class JSONExporter(ExportProvider):
     """
     JSON export implementation.
     
-    Exports investigation data as formatted JSON.
+    Exports investigation data as compact JSON, or indented JSON
+    when the ``pretty`` option is set.
     """
     
     @property
@@ -34,23 +56,30 @@ class JSONExporter(ExportProvider):
         output_path: str,
         options: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Export investigation to JSON file."""
+        """
+        Export investigation to JSON file, streaming one record at a time.
+        
+        Output is compact unless ``options["pretty"]`` is True (or an
+        explicit ``options["indent"]`` is given).
+        """
         try:
             options = options or {}
-            indent = options.get("indent", 2)
+            indent = self._indent(options)
             include_raw_html = options.get("include_raw_html", False)
             
-            data = self.to_dict(investigation, include_raw_html=include_raw_html)
-            
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=indent, default=str, ensure_ascii=False)
+            with atomic_write(output_file) as f:
+                write_json_document(
+                    f,
+                    self._iter_members(investigation, include_raw_html),
+                    indent,
+                )
             
             return True
-        except Exception as e:
-            print(f"Export failed: {e}")
+        except Exception:
+            _logger.exception("JSON export failed for %s", output_path)
             return False
     
     def export_bytes(
@@ -58,14 +87,28 @@ class JSONExporter(ExportProvider):
         investigation: Investigation,
         options: Optional[Dict[str, Any]] = None
     ) -> bytes:
-        """Export investigation to JSON bytes."""
+        """
+        Export investigation to JSON bytes.
+        
+        Output is compact unless ``options["pretty"]`` is True (or an
+        explicit ``options["indent"]`` is given).
+        """
         options = options or {}
-        indent = options.get("indent", 2)
+        indent = self._indent(options)
         include_raw_html = options.get("include_raw_html", False)
         
-        data = self.to_dict(investigation, include_raw_html=include_raw_html)
-        
-        return json.dumps(data, indent=indent, default=str, ensure_ascii=False).encode("utf-8")
+        # Encode record by record instead of building the full dict first
+        buffer = io.BytesIO()
+        write_json_document(
+            buffer,
+            self._iter_members(investigation, include_raw_html),
+            indent,
+        )
+        return buffer.getvalue()
+    
+    def _indent(self, options: Dict[str, Any]) -> Optional[int]:
+        """Get the indentation width requested by export options."""
+        return options.get("indent", 2 if options.get("pretty") else None)
     
     def to_dict(
         self,
@@ -73,72 +116,84 @@ class JSONExporter(ExportProvider):
         include_raw_html: bool = False
     ) -> Dict[str, Any]:
         """Convert investigation to dictionary."""
-        # Search results
-        search_results = []
-        for result in investigation.search_results:
-            result_dict = {
+        return {
+            key: list(value) if isinstance(value, Iterator) else value
+            for key, value in self._iter_members(investigation, include_raw_html)
+        }
+    
+    def _iter_members(
+        self,
+        investigation: Investigation,
+        include_raw_html: bool = False
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the top-level members of the export document in order.
+        
+        Record lists are yielded as lazy iterators so a streaming writer
+        can encode them without building every record dict up front.
+        """
+        yield "investigation", {
+            "id": investigation.id,
+            "query": investigation.query,
+            "status": investigation.status.value,
+            "created_at": _iso(investigation.created_at),
+            "updated_at": _iso(investigation.updated_at),
+            "completed_at": _iso(investigation.completed_at),
+            "summary": investigation.summary,
+            "tags": investigation.tags,
+            "metadata": investigation.metadata,
+        }
+        yield "statistics", {
+            "search_results_count": len(investigation.search_results),
+            "scraped_pages_count": len(investigation.scraped_content),
+            "entities_count": len(investigation.extracted_entities),
+        }
+        search_results = investigation.search_results
+        search_result_dicts = (
+            {
                 "id": result.id,
                 "url": result.url,
                 "title": result.title,
                 "description": result.description,
                 "source_engine": result.source_engine,
-                "discovered_at": result.discovered_at.isoformat() if result.discovered_at else None,
+                "discovered_at": _iso(result.discovered_at),
                 "relevance_score": result.relevance_score,
             }
-            if include_raw_html and result.raw_html:
-                result_dict["raw_html"] = result.raw_html
-            search_results.append(result_dict)
+            for result in search_results
+        )
+        if include_raw_html:
+            search_result_dicts = _with_raw_html(search_result_dicts, search_results)
+        yield "search_results", search_result_dicts
         
-        # Scraped content
-        scraped_content = []
-        for content in investigation.scraped_content:
-            content_dict = {
+        scraped_content = investigation.scraped_content
+        scraped_content_dicts = (
+            {
                 "id": content.id,
                 "url": content.url,
                 "title": content.title,
                 "clean_text": content.clean_text,
-                "scraped_at": content.scraped_at.isoformat() if content.scraped_at else None,
+                "scraped_at": _iso(content.scraped_at),
                 "status_code": content.status_code,
                 "content_type": content.content_type,
                 "language": content.language,
             }
-            if include_raw_html and content.raw_html:
-                content_dict["raw_html"] = content.raw_html
-            scraped_content.append(content_dict)
+            for content in scraped_content
+        )
+        if include_raw_html:
+            scraped_content_dicts = _with_raw_html(scraped_content_dicts, scraped_content)
+        yield "scraped_content", scraped_content_dicts
         
-        # Entities
-        entities = []
-        for entity in investigation.extracted_entities:
-            entities.append({
+        yield "extracted_entities", (
+            {
                 "id": entity.id,
                 "entity_type": entity.entity_type,
                 "value": entity.value,
                 "confidence": entity.confidence,
                 "context": entity.context,
                 "source_url": entity.source_url,
-            })
-        
-        return {
-            "investigation": {
-                "id": investigation.id,
-                "query": investigation.query,
-                "status": investigation.status.value,
-                "created_at": investigation.created_at.isoformat() if investigation.created_at else None,
-                "updated_at": investigation.updated_at.isoformat() if investigation.updated_at else None,
-                "completed_at": investigation.completed_at.isoformat() if investigation.completed_at else None,
-                "summary": investigation.summary,
-                "tags": investigation.tags,
-                "metadata": investigation.metadata,
-            },
-            "statistics": {
-                "search_results_count": len(search_results),
-                "scraped_pages_count": len(scraped_content),
-                "entities_count": len(entities),
-            },
-            "search_results": search_results,
-            "scraped_content": scraped_content,
-            "extracted_entities": entities,
-            "exported_at": datetime.now().isoformat(),
-            "export_format": "json",
-            "version": "1.0",
-        }
+            }
+            for entity in investigation.extracted_entities
+        )
+        yield "exported_at", datetime.now(timezone.utc).isoformat()
+        yield "export_format", "json"
+        yield "version", "1.0"
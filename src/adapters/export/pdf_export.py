@@ -1,12 +1,91 @@
 """PDF export adapter."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Union, BinaryIO
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+import logging
 import io
 
 from ...core.interfaces.export import ExportProvider
 from ...core.entities.investigation import Investigation
+from .base import atomic_write
+
+
+_logger = logging.getLogger("robin.export.pdf")
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+        PageBreak
+    )
+    _HAS_REPORTLAB = True
+except ImportError:
+    _HAS_REPORTLAB = False
+
+if _HAS_REPORTLAB:
+    # Paragraph and table styles are constant, so build them once rather than per report
+    _STYLES = getSampleStyleSheet()
+    
+    _TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.darkblue,
+    )
+    
+    _HEADING_STYLE = ParagraphStyle(
+        'CustomHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=14,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor=colors.darkblue,
+    )
+    
+    _SUMMARY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ])
+    
+    _ENTITY_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ('WORDWRAP', (1, 1), (1, -1), True),
+    ])
+    
+    _RESULTS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ])
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to at most ``limit`` characters, ending cut text with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1] + "\u2026"
 
 
 class PDFExporter(ExportProvider):
@@ -36,17 +115,19 @@ class PDFExporter(ExportProvider):
     ) -> bool:
         """Export investigation to PDF file."""
         try:
-            pdf_bytes = self.export_bytes(investigation, options)
-            
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, "wb") as f:
-                f.write(pdf_bytes)
+            with atomic_write(output_file) as f:
+                if _HAS_REPORTLAB:
+                    # Let ReportLab write the file instead of buffering it first
+                    self._render(self._build_elements(investigation, options), f)
+                else:
+                    f.write(self._generate_simple_pdf(investigation, options))
             
             return True
-        except Exception as e:
-            print(f"Export failed: {e}")
+        except Exception:
+            _logger.exception("PDF export failed for %s", output_path)
             return False
     
     def export_bytes(
@@ -55,20 +136,11 @@ class PDFExporter(ExportProvider):
         options: Optional[Dict[str, Any]] = None
     ) -> bytes:
         """Export investigation to PDF bytes."""
-        try:
-            from reportlab.lib import colors
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.platypus import (
-                SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-                PageBreak, ListFlowable, ListItem
-            )
-            
+        if _HAS_REPORTLAB:
             return self._generate_pdf_reportlab(investigation, options)
-        except ImportError:
-            # Fallback to simple text-based PDF if reportlab not available
-            return self._generate_simple_pdf(investigation, options)
+        
+        # Fallback to simple text-based PDF if reportlab not available
+        return self._generate_simple_pdf(investigation, options)
     
     def _generate_pdf_reportlab(
         self,
@@ -76,36 +148,29 @@ class PDFExporter(ExportProvider):
         options: Optional[Dict[str, Any]] = None
     ) -> bytes:
         """Generate PDF using ReportLab."""
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import (
-            SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-            PageBreak
-        )
-        
         buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.darkblue,
-        )
+        self._render(self._build_elements(investigation, options), buffer)
+        return buffer.getvalue()
+    
+    def _render(self, elements: List[Any], output: Union[str, BinaryIO]) -> None:
+        """
+        Lay out report elements as a PDF.
         
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.darkblue,
-        )
+        Args:
+            elements: Flowables from _build_elements
+            output: File path or binary file to write the PDF to
+        """
+        SimpleDocTemplate(output, pagesize=letter).build(elements)
+    
+    def _build_elements(
+        self,
+        investigation: Investigation,
+        options: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """Build the ReportLab flowables for the investigation report."""
+        styles = _STYLES
+        title_style = _TITLE_STYLE
+        heading_style = _HEADING_STYLE
         
         elements = []
         
@@ -127,16 +192,7 @@ class PDFExporter(ExportProvider):
         ]
         
         summary_table = Table(summary_data, colWidths=[2*inch, 4*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ]))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         elements.append(summary_table)
         elements.append(Spacer(1, 20))
         
@@ -150,31 +206,20 @@ class PDFExporter(ExportProvider):
         if investigation.extracted_entities:
             elements.append(Paragraph("Extracted Entities", heading_style))
             
-            # Group entities by type
-            entities_by_type = {}
+            # Group unique entity values by type, keeping the first 10 per type.
+            # Dict keys dedup like a set but keep first-seen order.
+            entities_by_type = defaultdict(dict)
             for entity in investigation.extracted_entities:
-                etype = entity.entity_type
-                if etype not in entities_by_type:
-                    entities_by_type[etype] = []
-                entities_by_type[etype].append(entity.value)
+                values = entities_by_type[entity.entity_type]
+                if len(values) < 10:
+                    values[entity.value] = None
             
             entity_data = [["Type", "Values Found"]]
             for etype, values in entities_by_type.items():
-                unique_values = list(set(values))[:10]  # Limit to 10 per type
-                entity_data.append([etype, ", ".join(unique_values)])
+                entity_data.append([etype, ", ".join(values)])
             
             entity_table = Table(entity_data, colWidths=[1.5*inch, 4.5*inch])
-            entity_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('WORDWRAP', (1, 1), (1, -1), True),
-            ]))
+            entity_table.setStyle(_ENTITY_TABLE_STYLE)
             elements.append(entity_table)
             elements.append(Spacer(1, 20))
         
@@ -183,23 +228,13 @@ class PDFExporter(ExportProvider):
             elements.append(PageBreak())
             elements.append(Paragraph("Search Results (Top 20)", heading_style))
             
-            results_data = [["#", "Title", "URL"]]
-            for i, result in enumerate(investigation.search_results[:20], 1):
-                title = result.title[:50] + "..." if len(result.title) > 50 else result.title
-                url = result.url[:60] + "..." if len(result.url) > 60 else result.url
-                results_data.append([str(i), title, url])
+            results_data = [["#", "Title", "URL"]] + [
+                [str(i), _truncate(result.title, 50), _truncate(result.url, 60)]
+                for i, result in enumerate(investigation.search_results[:20], 1)
+            ]
             
             results_table = Table(results_data, colWidths=[0.4*inch, 2.5*inch, 3.1*inch])
-            results_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                ('TOPPADDING', (0, 0), (-1, -1), 4),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ]))
+            results_table.setStyle(_RESULTS_TABLE_STYLE)
             elements.append(results_table)
         
         # Footer
@@ -207,10 +242,7 @@ class PDFExporter(ExportProvider):
         footer_text = f"Generated by Robin Dark Web OSINT Tool on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         elements.append(Paragraph(footer_text, styles['Normal']))
         
-        # Build PDF
-        doc.build(elements)
-        
-        return buffer.getvalue()
+        return elements
     
     def _generate_simple_pdf(
         self,
@@ -1,13 +1,77 @@
 """STIX 2.1 export adapter for threat intelligence sharing."""
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, Iterator
+from datetime import datetime, timezone
 import json
+import re
 import uuid
 from pathlib import Path
+from urllib.parse import urlsplit
+import logging
 
 from ...core.interfaces.export import ExportProvider
 from ...core.entities.investigation import Investigation
+from .base import atomic_write, dumps_json
+
+
+_logger = logging.getLogger("robin.export.stix")
+
+_ONION_RE = re.compile(r"\.onion$", re.IGNORECASE)
+
+# Namespace the STIX 2.1 spec defines for deterministic observable IDs
+_SCO_NAMESPACE = uuid.UUID("00abedb4-aa42-466c-9c01-fed23315a9b7")
+
+# Namespace for IDs of Robin's own objects, e.g. URL indicators
+_ROBIN_NAMESPACE = uuid.UUID("37fe559f-4559-4255-8519-16d736a0a682")
+
+# Every export is attributed to the same identity object. STIX requires
+# an object's created time to be fixed for its ID, so it is a constant.
+_IDENTITY_ID = f"identity--{uuid.uuid5(_ROBIN_NAMESPACE, 'identity')}"
+_IDENTITY_CREATED = "2024-01-01T00:00:00.000Z"
+
+# Hex digest length -> STIX hash algorithm name
+_HASH_BY_LEN = {32: "MD5", 40: "SHA-1", 64: "SHA-256", 128: "SHA-512"}
+
+
+def _is_onion_url(url: Optional[str]) -> bool:
+    """Check whether a URL's host is a .onion address."""
+    if not url:
+        return False
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return False
+    return bool(host and _ONION_RE.search(host))
+
+
+def _stix_timestamp(value: datetime) -> str:
+    """
+    Format a datetime as a STIX timestamp.
+    
+    STIX requires UTC with a "Z" suffix and millisecond precision.
+    Naive datetimes are taken to be UTC, as entities store them.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="milliseconds") + "Z"
+
+
+def _observable_id(object_type: str, properties: Dict[str, Any]) -> str:
+    """
+    Build the deterministic STIX 2.1 ID of a cyber observable.
+    
+    The same observable always gets the same ID, so consumers can
+    deduplicate it across exports.
+    
+    Args:
+        object_type: STIX object type, e.g. "email-addr"
+        properties: The object's ID contributing properties
+        
+    Returns:
+        STIX identifier such as "email-addr--<uuid5>"
+    """
+    name = json.dumps(properties, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return f"{object_type}--{uuid.uuid5(_SCO_NAMESPACE, name)}"
 
 
 class STIXExporter(ExportProvider):
@@ -38,19 +102,24 @@ class STIXExporter(ExportProvider):
         output_path: str,
         options: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Export investigation to STIX 2.1 bundle."""
+        """
+        Export investigation to STIX 2.1 bundle.
+        
+        Output is compact unless ``options["pretty"]`` is True.
+        """
         try:
             bundle = self._create_stix_bundle(investigation, options)
+            indent = 2 if (options or {}).get("pretty") else None
             
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(bundle, f, indent=2, default=str)
+            with atomic_write(output_file) as f:
+                f.write(dumps_json(bundle, indent))
             
             return True
-        except Exception as e:
-            print(f"Export failed: {e}")
+        except Exception:
+            _logger.exception("STIX export failed for %s", output_path)
             return False
     
     def export_bytes(
@@ -58,9 +127,14 @@ class STIXExporter(ExportProvider):
         investigation: Investigation,
         options: Optional[Dict[str, Any]] = None
     ) -> bytes:
-        """Export investigation to STIX 2.1 bytes."""
+        """
+        Export investigation to STIX 2.1 bytes.
+        
+        Output is compact unless ``options["pretty"]`` is True.
+        """
         bundle = self._create_stix_bundle(investigation, options)
-        return json.dumps(bundle, indent=2, default=str).encode("utf-8")
+        indent = 2 if (options or {}).get("pretty") else None
+        return dumps_json(bundle, indent)
     
     def _create_stix_bundle(
         self,
@@ -70,33 +144,20 @@ class STIXExporter(ExportProvider):
         """Create a STIX 2.1 bundle from the investigation."""
         options = options or {}
         
-        objects = []
+        # One timestamp for the whole bundle
+        now = _stix_timestamp(datetime.now(timezone.utc))
         
         # Create identity for the tool
         identity = self._create_identity()
-        objects.append(identity)
         
         # Create report for the investigation
-        report = self._create_report(investigation, identity["id"])
-        objects.append(report)
+        report = self._create_report(investigation, identity["id"], now)
         
-        # Convert entities to STIX objects
-        entity_refs = []
-        for entity in investigation.extracted_entities:
-            stix_obj = self._entity_to_stix(entity, identity["id"])
-            if stix_obj:
-                objects.append(stix_obj)
-                entity_refs.append(stix_obj["id"])
-        
-        # Create indicators for URLs
-        for result in investigation.search_results:
-            indicator = self._url_to_indicator(result, identity["id"])
-            if indicator:
-                objects.append(indicator)
-                entity_refs.append(indicator["id"])
+        objects = [identity, report]
+        objects.extend(self._iter_stix_objects(investigation, identity["id"], now))
         
         # Update report with object references
-        report["object_refs"] = entity_refs
+        report["object_refs"] = [obj["id"] for obj in objects[2:]]
         
         return {
             "type": "bundle",
@@ -104,14 +165,43 @@ class STIXExporter(ExportProvider):
             "objects": objects,
         }
     
+    def _iter_stix_objects(
+        self,
+        investigation: Investigation,
+        identity_id: str,
+        now: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the STIX objects for the investigation's entities and URLs.
+        
+        IDs are deterministic, so an entity found on several pages is
+        only yielded once.
+        """
+        seen_ids = set()
+        
+        for entity in investigation.extracted_entities:
+            stix_obj = self._entity_to_stix(entity, identity_id)
+            if stix_obj and stix_obj["id"] not in seen_ids:
+                seen_ids.add(stix_obj["id"])
+                yield stix_obj
+        
+        # Only hidden service URLs become indicators
+        for result in investigation.search_results:
+            if not _is_onion_url(result.url):
+                continue
+            indicator = self._url_to_indicator(result, identity_id, now)
+            if indicator["id"] not in seen_ids:
+                seen_ids.add(indicator["id"])
+                yield indicator
+    
     def _create_identity(self) -> Dict[str, Any]:
         """Create STIX identity for Robin."""
         return {
             "type": "identity",
             "spec_version": self.STIX_VERSION,
-            "id": f"identity--{uuid.uuid4()}",
-            "created": datetime.utcnow().isoformat() + "Z",
-            "modified": datetime.utcnow().isoformat() + "Z",
+            "id": _IDENTITY_ID,
+            "created": _IDENTITY_CREATED,
+            "modified": _IDENTITY_CREATED,
             "name": "Robin Dark Web OSINT Tool",
             "identity_class": "system",
             "description": "Automated dark web intelligence collection tool",
@@ -120,18 +210,19 @@ class STIXExporter(ExportProvider):
     def _create_report(
         self,
         investigation: Investigation,
-        identity_id: str
+        identity_id: str,
+        now: str
     ) -> Dict[str, Any]:
         """Create STIX report for the investigation."""
         return {
             "type": "report",
             "spec_version": self.STIX_VERSION,
             "id": f"report--{investigation.id}",
-            "created": investigation.created_at.isoformat() + "Z" if investigation.created_at else datetime.utcnow().isoformat() + "Z",
-            "modified": investigation.updated_at.isoformat() + "Z" if investigation.updated_at else datetime.utcnow().isoformat() + "Z",
+            "created": _stix_timestamp(investigation.created_at) if investigation.created_at else now,
+            "modified": _stix_timestamp(investigation.updated_at) if investigation.updated_at else now,
             "name": f"Dark Web Investigation: {investigation.query}",
             "description": investigation.summary or f"Investigation results for query: {investigation.query}",
-            "published": datetime.utcnow().isoformat() + "Z",
+            "published": now,
             "created_by_ref": identity_id,
             "labels": investigation.tags or ["dark-web", "osint"],
             "object_refs": [],  # Will be populated later
@@ -139,114 +230,106 @@ class STIXExporter(ExportProvider):
     
     def _entity_to_stix(self, entity, identity_id: str) -> Optional[Dict[str, Any]]:
         """Convert an extracted entity to a STIX object."""
-        entity_type = entity.entity_type.lower()
-        
-        # Map entity types to STIX types
-        if entity_type == "email":
-            return self._create_email_addr(entity, identity_id)
-        elif entity_type == "crypto_wallet":
-            return self._create_cryptocurrency_wallet(entity, identity_id)
-        elif entity_type == "domain":
-            return self._create_domain_name(entity, identity_id)
-        elif entity_type == "ip_address":
-            return self._create_ipv4_addr(entity, identity_id)
-        elif entity_type == "url":
-            return self._create_url(entity, identity_id)
-        elif entity_type == "hash":
-            return self._create_file_hash(entity, identity_id)
-        
-        return None
+        builder = self._ENTITY_BUILDERS.get(entity.entity_type.lower())
+        if builder is None:
+            return None
+        return builder(self, entity, identity_id)
     
-    def _create_email_addr(self, entity, identity_id: str) -> Dict[str, Any]:
-        """Create STIX email-addr object."""
+    def _observable(
+        self,
+        object_type: str,
+        properties: Dict[str, Any],
+        **extra: Any
+    ) -> Dict[str, Any]:
+        """
+        Build a STIX cyber observable.
+        
+        Args:
+            object_type: STIX object type
+            properties: ID contributing properties, also included in the object
+            **extra: Other properties that don't affect the ID
+            
+        Returns:
+            STIX object dictionary
+        """
         return {
-            "type": "email-addr",
+            "type": object_type,
             "spec_version": self.STIX_VERSION,
-            "id": f"email-addr--{uuid.uuid4()}",
-            "value": entity.value,
+            "id": _observable_id(object_type, properties),
+            **properties,
+            **extra,
         }
     
+    def _create_email_addr(self, entity, identity_id: str) -> Dict[str, Any]:
+        """Create STIX email-addr object."""
+        return self._observable("email-addr", {"value": entity.value})
+    
     def _create_cryptocurrency_wallet(self, entity, identity_id: str) -> Dict[str, Any]:
         """Create STIX custom cryptocurrency wallet object."""
-        return {
-            "type": "x-cryptocurrency-wallet",
-            "spec_version": self.STIX_VERSION,
-            "id": f"x-cryptocurrency-wallet--{uuid.uuid4()}",
-            "address": entity.value,
-            "currency": entity.metadata.get("currency", "unknown") if hasattr(entity, 'metadata') else "unknown",
-        }
+        return self._observable(
+            "x-cryptocurrency-wallet",
+            {"address": entity.value},
+            currency=entity.metadata.get("currency", "unknown") if hasattr(entity, 'metadata') else "unknown",
+        )
     
     def _create_domain_name(self, entity, identity_id: str) -> Dict[str, Any]:
         """Create STIX domain-name object."""
-        return {
-            "type": "domain-name",
-            "spec_version": self.STIX_VERSION,
-            "id": f"domain-name--{uuid.uuid4()}",
-            "value": entity.value,
-        }
+        return self._observable("domain-name", {"value": entity.value})
     
     def _create_ipv4_addr(self, entity, identity_id: str) -> Dict[str, Any]:
         """Create STIX ipv4-addr object."""
-        return {
-            "type": "ipv4-addr",
-            "spec_version": self.STIX_VERSION,
-            "id": f"ipv4-addr--{uuid.uuid4()}",
-            "value": entity.value,
-        }
+        return self._observable("ipv4-addr", {"value": entity.value})
     
     def _create_url(self, entity, identity_id: str) -> Dict[str, Any]:
         """Create STIX url object."""
-        return {
-            "type": "url",
-            "spec_version": self.STIX_VERSION,
-            "id": f"url--{uuid.uuid4()}",
-            "value": entity.value,
-        }
+        return self._observable("url", {"value": entity.value})
     
     def _create_file_hash(self, entity, identity_id: str) -> Dict[str, Any]:
         """Create STIX file object with hash."""
         hash_type = self._detect_hash_type(entity.value)
-        
-        return {
-            "type": "file",
-            "spec_version": self.STIX_VERSION,
-            "id": f"file--{uuid.uuid4()}",
-            "hashes": {
-                hash_type: entity.value,
-            },
-        }
+        return self._observable("file", {"hashes": {hash_type: entity.value}})
     
-    def _url_to_indicator(self, result, identity_id: str) -> Optional[Dict[str, Any]]:
-        """Convert a search result URL to a STIX indicator."""
-        if not result.url or not ".onion" in result.url:
-            return None
+    # Entity type -> STIX object builder
+    _ENTITY_BUILDERS = {
+        "email": _create_email_addr,
+        "crypto_wallet": _create_cryptocurrency_wallet,
+        "domain": _create_domain_name,
+        "ip_address": _create_ipv4_addr,
+        "url": _create_url,
+        "hash": _create_file_hash,
+    }
+    
+    def _url_to_indicator(
+        self,
+        result,
+        identity_id: str,
+        now: str
+    ) -> Dict[str, Any]:
+        """
+        Convert a .onion search result URL to a STIX indicator.
+        
+        The ID is derived from the URL, so the timestamps come from when
+        the URL was discovered rather than the export time, keeping the
+        object identical between exports.
+        """
+        discovered_at = getattr(result, "discovered_at", None)
+        created = _stix_timestamp(discovered_at) if discovered_at else now
         
         return {
             "type": "indicator",
             "spec_version": self.STIX_VERSION,
-            "id": f"indicator--{uuid.uuid4()}",
-            "created": datetime.utcnow().isoformat() + "Z",
-            "modified": datetime.utcnow().isoformat() + "Z",
+            "id": f"indicator--{uuid.uuid5(_ROBIN_NAMESPACE, result.url)}",
+            "created": created,
+            "modified": created,
             "name": result.title or "Dark Web URL",
             "description": result.description or f"Dark web URL discovered: {result.url}",
             "indicator_types": ["unknown"],
             "pattern": f"[url:value = '{result.url}']",
             "pattern_type": "stix",
-            "valid_from": datetime.utcnow().isoformat() + "Z",
+            "valid_from": created,
             "created_by_ref": identity_id,
         }
     
     def _detect_hash_type(self, hash_value: str) -> str:
         """Detect hash type based on length."""
-        length = len(hash_value)
-        
-        if length == 32:
-            return "MD5"
-        elif length == 40:
-            return "SHA-1"
-        elif length == 64:
-            return "SHA-256"
-        elif length == 128:
-            return "SHA-512"
-        
-        return "unknown"
+        return _HASH_BY_LEN.get(len(hash_value), "unknown")
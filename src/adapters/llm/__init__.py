@@ -1,11 +1,21 @@
-"""LLM provider adapters."""
+"""LLM provider adapters.
 
-from .base import BaseLLMProvider
-from .openai import OpenAIProvider
-from .anthropic import AnthropicProvider
-from .google import GoogleProvider
-from .ollama import OllamaProvider
-from .factory import LLMFactory, get_llm_provider
+Provider classes are imported on first access, since each provider
+module loads its vendor SDK and most runs only use one of them.
+"""
+
+import importlib
+
+# Maps public names to the submodule that defines them
+_LAZY = {
+    "BaseLLMProvider": ".base",
+    "OpenAIProvider": ".openai",
+    "AnthropicProvider": ".anthropic",
+    "GoogleProvider": ".google",
+    "OllamaProvider": ".ollama",
+    "LLMFactory": ".factory",
+    "get_llm_provider": ".factory",
+}
 
 __all__ = [
     "BaseLLMProvider",
@@ -16,3 +26,16 @@ __all__ = [
     "LLMFactory",
     "get_llm_provider",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
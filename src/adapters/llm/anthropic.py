@@ -1,9 +1,10 @@
 """Anthropic LLM provider."""
 
-from typing import Optional, List, Callable, AsyncIterator
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator
 import os
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, _http2_available
+from .stream_buffer import StreamBuffer
 from ...core.interfaces.llm_provider import LLMConfig, LLMResponse
 
 
@@ -34,18 +35,36 @@ class AnthropicProvider(BaseLLMProvider):
     def initialize(self) -> None:
         """Initialize the Anthropic client."""
         try:
-            from anthropic import Anthropic
+            from anthropic import (
+                Anthropic,
+                AsyncAnthropic,
+                DefaultAsyncHttpxClient,
+                DefaultHttpxClient,
+            )
+            
+            self._api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
+            
+            if not self._api_key:
+                raise ValueError("ANTHROPIC_API_KEY environment variable not set")
             
-            api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
+            # HTTP/2 multiplexes concurrent requests over one connection
+            http2 = _http2_available()
             
             self._client = Anthropic(
-                api_key=api_key,
+                api_key=self._api_key,
+                timeout=self.config.timeout,
+                http_client=DefaultHttpxClient(http2=True) if http2 else None,
+            )
+            # Created once so async calls share one connection pool
+            self._async_client = AsyncAnthropic(
+                api_key=self._api_key,
                 timeout=self.config.timeout,
+                http_client=DefaultAsyncHttpxClient(http2=True) if http2 else None,
             )
         except ImportError:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
     
-    def complete(
+    def _complete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -55,15 +74,7 @@ class AnthropicProvider(BaseLLMProvider):
         if self._client is None:
             self.initialize()
         
-        message_kwargs = {
-            "model": self.config.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens or 4096),
-            "temperature": kwargs.get("temperature", self.config.temperature),
-        }
-        
-        if system_prompt:
-            message_kwargs["system"] = system_prompt
+        message_kwargs = self._build_message_kwargs(prompt, system_prompt, kwargs)
         
         response = self._client.messages.create(**message_kwargs)
         
@@ -91,49 +102,35 @@ class AnthropicProvider(BaseLLMProvider):
         if self._client is None:
             self.initialize()
         
-        message_kwargs = {
-            "model": self.config.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens or 4096),
-            "temperature": kwargs.get("temperature", self.config.temperature),
-        }
-        
-        if system_prompt:
-            message_kwargs["system"] = system_prompt
+        message_kwargs = self._build_message_kwargs(prompt, system_prompt, kwargs)
         
-        full_content = ""
+        parts: List[str] = []
+        buffer = StreamBuffer(callback) if callback else None
         
         with self._client.messages.stream(**message_kwargs) as stream:
             for text in stream.text_stream:
-                full_content += text
-                if callback:
-                    callback(text)
+                parts.append(text)
+                if buffer:
+                    buffer.push(text)
+        
+        if buffer:
+            buffer.flush()
         
-        return full_content
+        return "".join(parts)
     
-    async def acomplete(
+    async def _acomplete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Async completion."""
-        from anthropic import AsyncAnthropic
-        
-        api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
-        client = AsyncAnthropic(api_key=api_key)
-        
-        message_kwargs = {
-            "model": self.config.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens or 4096),
-            "temperature": kwargs.get("temperature", self.config.temperature),
-        }
+        if self._async_client is None:
+            self.initialize()
         
-        if system_prompt:
-            message_kwargs["system"] = system_prompt
+        message_kwargs = self._build_message_kwargs(prompt, system_prompt, kwargs)
         
-        response = await client.messages.create(**message_kwargs)
+        response = await self._async_client.messages.create(**message_kwargs)
         
         content = response.content[0].text if response.content else ""
         
@@ -153,24 +150,33 @@ class AnthropicProvider(BaseLLMProvider):
         **kwargs
     ) -> AsyncIterator[str]:
         """Async streaming."""
-        from anthropic import AsyncAnthropic
+        if self._async_client is None:
+            self.initialize()
         
-        api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
-        client = AsyncAnthropic(api_key=api_key)
+        message_kwargs = self._build_message_kwargs(prompt, system_prompt, kwargs)
         
+        async with self._async_client.messages.stream(**message_kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+    
+    def _build_message_kwargs(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the Messages API request shared by all completion methods."""
         message_kwargs = {
             "model": self.config.model_name,
             "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens or 4096),
+            "max_tokens": kwargs.get("max_tokens") or self.config.max_tokens or 4096,
             "temperature": kwargs.get("temperature", self.config.temperature),
         }
         
         if system_prompt:
             message_kwargs["system"] = system_prompt
         
-        async with client.messages.stream(**message_kwargs) as stream:
-            async for text in stream.text_stream:
-                yield text
+        return message_kwargs
     
     def _create_langchain_llm(self):
         """Create LangChain Anthropic instance."""
@@ -1,37 +1,299 @@
 """Base LLM provider with common functionality."""
 
 from abc import abstractmethod
-from typing import Optional, List, Callable, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Optional, List, Callable, AsyncIterator, Dict, Any
+import asyncio
+import functools
+import importlib.util
+import logging
+import time
+import weakref
 
+from ...core.interfaces.cache import CacheProvider
 from ...core.interfaces.llm_provider import LLMProvider, LLMConfig, LLMResponse
 
 
+_logger = logging.getLogger("robin.llm")
+
+# LangChain LLMs shared by providers with the same configuration
+_langchain_llms: "weakref.WeakValueDictionary[tuple, Any]" = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model_name: str):
+    """
+    Get the tiktoken encoding for a model, loaded once per model.
+    
+    Models tiktoken doesn't know (Claude, Gemini, local models) use
+    cl100k_base as an approximation.
+    
+    Returns:
+        The encoding, or None if tiktoken is not installed or its
+        vocabulary can't be loaded (it is downloaded on first use)
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        _logger.debug("tiktoken encoding unavailable, estimating tokens from length: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _http2_available() -> bool:
+    """Check whether httpx can use HTTP/2, which needs the h2 package."""
+    return importlib.util.find_spec("h2") is not None
+
+
 class BaseLLMProvider(LLMProvider):
     """
     Base implementation for LLM providers with common functionality.
+    
+    Subclasses implement ``_complete``/``_acomplete``. When a cache
+    provider is given, deterministic (temperature 0) completions are
+    served from it instead of calling the API again.
+    
+    LLMFactory.create initializes providers before returning them.
+    Providers constructed directly initialize lazily on first use.
     """
     
-    def __init__(self, config: LLMConfig):
+    # How long cached completions stay valid
+    CACHE_TTL = timedelta(hours=24)
+    
+    # Seconds a health check result is reused before checking again
+    HEALTH_CHECK_TTL = 30.0
+    
+    # Models the provider supports, in display order. Override in subclasses.
+    SUPPORTED_MODELS: List[str] = []
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Lower-cased model names, so validate_model is a set lookup
+        cls._model_names = frozenset(m.lower() for m in cls.SUPPORTED_MODELS)
+    
+    def __init__(self, config: LLMConfig, cache: Optional[CacheProvider] = None):
         super().__init__(config)
         self._langchain_llm = None
+        self._async_client = None
+        self._cache = cache
+        self._health_checked_until = 0.0
+        self._health_ok = False
+    
+    def complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """Generate a completion, using the response cache when possible."""
+        key = self._cache_key(prompt, system_prompt, kwargs)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return self._cached_response(cached)
+        
+        response = self._complete(prompt, system_prompt, **kwargs)
+        
+        if key is not None:
+            self._cache.set(key, asdict(response), self.CACHE_TTL)
+        return response
+    
+    async def acomplete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Async completion, using the response cache when possible.
+        
+        Cache calls run in a worker thread, since cache providers are
+        synchronous and may do I/O (Redis, SQLite).
+        """
+        key = self._cache_key(prompt, system_prompt, kwargs)
+        if key is not None:
+            cached = await asyncio.to_thread(self._cache.get, key)
+            if cached is not None:
+                return self._cached_response(cached)
+        
+        response = await self._acomplete(prompt, system_prompt, **kwargs)
+        
+        if key is not None:
+            await asyncio.to_thread(self._cache.set, key, asdict(response), self.CACHE_TTL)
+        return response
+    
+    def batch_complete(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = 10,
+        **kwargs
+    ) -> List[LLMResponse]:
+        """
+        Generate completions for several prompts concurrently.
+        
+        Args:
+            prompts: The user prompts
+            system_prompt: Optional system prompt shared by all prompts
+            max_concurrency: Maximum number of requests in flight
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            Responses in the same order as the prompts
+        """
+        if not prompts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as executor:
+            return list(executor.map(
+                lambda prompt: self.complete(prompt, system_prompt, **kwargs),
+                prompts,
+            ))
+    
+    async def abatch_complete(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = 10,
+        **kwargs
+    ) -> List[LLMResponse]:
+        """Async version of batch_complete."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def complete_one(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.acomplete(prompt, system_prompt, **kwargs)
+        
+        return list(await asyncio.gather(*[complete_one(prompt) for prompt in prompts]))
+    
+    @abstractmethod
+    def _complete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """Call the provider API for a completion. Override in subclasses."""
+        pass
+    
+    @abstractmethod
+    async def _acomplete(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """Call the provider API for an async completion. Override in subclasses."""
+        pass
+    
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Get the response cache key for a request.
+        
+        Returns:
+            The key, or None if there is no cache or the request is
+            not deterministic
+        """
+        if self._cache is None:
+            return None
+        if kwargs.get("temperature", self.config.temperature) != 0:
+            return None
+        
+        # Per-call options override the configured defaults
+        options = {"max_tokens": self.config.max_tokens, "top_p": self.config.top_p, **kwargs}
+        digest = self._cache.generate_key(prompt, system_prompt, **options)
+        return f"llm:{self.provider_name}:{self.config.model_name}:{digest}"
+    
+    @staticmethod
+    def _cached_response(data: Dict[str, Any]) -> LLMResponse:
+        """Rebuild a cached response, marking it as served from the cache."""
+        return LLMResponse(**{**data, "metadata": {**data["metadata"], "cached": True}})
+    
+    def validate_model(self, model_name: str) -> bool:
+        """Check if a model is supported by this provider."""
+        return model_name.lower() in self._model_names
     
     def estimate_tokens(self, text: str) -> int:
-        """Estimate token count (rough approximation)."""
-        # Average ~4 characters per token for English
-        return len(text) // 4
+        """Estimate token count, using tiktoken when available."""
+        encoding = _get_encoding(self.config.model_name)
+        if encoding is None:
+            # Average ~4 characters per token for English
+            return len(text) // 4
+        
+        # Scraped text may contain special-token markers; count them as text
+        return len(encoding.encode(text, disallowed_special=()))
     
     def health_check(self) -> bool:
-        """Check if provider is accessible."""
+        """
+        Check if provider is accessible.
+        
+        Each check is a billed completion, so the result is reused for
+        HEALTH_CHECK_TTL seconds.
+        """
+        now = time.monotonic()
+        if now < self._health_checked_until:
+            return self._health_ok
+        
         try:
-            response = self.complete("Hi", max_tokens=5)
-            return bool(response.content)
+            # Bypass the response cache, which would answer for a dead provider
+            response = self._complete("Hi", max_tokens=5)
+            ok = bool(response.content)
         except Exception:
-            return False
+            ok = False
+        
+        self._health_ok = ok
+        self._health_checked_until = now + self.HEALTH_CHECK_TTL
+        return ok
+    
+    async def aclose(self) -> None:
+        """Close the async client's connections, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     def get_langchain_llm(self):
-        """Return a LangChain-compatible LLM instance."""
+        """
+        Return a LangChain-compatible LLM instance.
+        
+        Providers with the same configuration share one instance for as
+        long as any of them holds it.
+        """
         if self._langchain_llm is None:
-            self._langchain_llm = self._create_langchain_llm()
+            key = (
+                self.provider_name,
+                self.config.model_name,
+                self.config.temperature,
+                self.config.streaming,
+                self.config.base_url,
+                self.config.api_key,
+            )
+            llm = _langchain_llms.get(key)
+            if llm is None:
+                llm = self._create_langchain_llm()
+                if llm is not None:
+                    _langchain_llms[key] = llm
+            self._langchain_llm = llm
         return self._langchain_llm
     
     @abstractmethod
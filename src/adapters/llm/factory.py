@@ -1,75 +1,98 @@
 """LLM provider factory."""
 
 from typing import Optional, Dict, Type
+import functools
+import importlib
 import os
 
 from .base import BaseLLMProvider
-from .openai import OpenAIProvider
-from .anthropic import AnthropicProvider
-from .google import GoogleProvider
-from .ollama import OllamaProvider
+from ...core.interfaces.cache import CacheProvider
 from ...core.interfaces.llm_provider import LLMConfig
 
 
+# Provider name -> (module, class). Provider modules import their SDKs,
+# so they are only loaded once a model needs them.
+_PROVIDERS = {
+    "openai": (".openai", "OpenAIProvider"),
+    "anthropic": (".anthropic", "AnthropicProvider"),
+    "google": (".google", "GoogleProvider"),
+    "ollama": (".ollama", "OllamaProvider"),
+}
+
 # Model to provider mapping
-MODEL_PROVIDER_MAP: Dict[str, Type[BaseLLMProvider]] = {
+MODEL_PROVIDER_MAP: Dict[str, str] = {
     # OpenAI models - GPT-5 series (2025)
-    "gpt-5.1": OpenAIProvider,        # Best for coding and agentic tasks
-    "gpt-5-mini": OpenAIProvider,     # Faster, cost-efficient
-    "gpt-5-nano": OpenAIProvider,     # Fastest, most cost-efficient
+    "gpt-5.1": "openai",     # Best for coding and agentic tasks
+    "gpt-5-mini": "openai",  # Faster, cost-efficient
+    "gpt-5-nano": "openai",  # Fastest, most cost-efficient
     # OpenAI models - GPT-4 series
-    "gpt-4.1": OpenAIProvider,
-    "gpt-4o": OpenAIProvider,
-    "gpt-4o-mini": OpenAIProvider,
-    "gpt-4-turbo": OpenAIProvider,
-    "gpt-4": OpenAIProvider,
-    "gpt-3.5-turbo": OpenAIProvider,
+    "gpt-4.1": "openai",
+    "gpt-4o": "openai",
+    "gpt-4o-mini": "openai",
+    "gpt-4-turbo": "openai",
+    "gpt-4": "openai",
+    "gpt-3.5-turbo": "openai",
     # OpenAI specialized models
-    "gpt-image-1": OpenAIProvider,    # Image generation
-    "o1": OpenAIProvider,             # Reasoning model
-    "o1-mini": OpenAIProvider,        # Mini reasoning model
+    "gpt-image-1": "openai",  # Image generation
+    "o1": "openai",           # Reasoning model
+    "o1-mini": "openai",      # Mini reasoning model
     
     # Anthropic models
-    "claude-3-opus-20240229": AnthropicProvider,
-    "claude-3-sonnet-20240229": AnthropicProvider,
-    "claude-3-haiku-20240307": AnthropicProvider,
-    "claude-3-5-sonnet-latest": AnthropicProvider,
-    "claude-sonnet-4-5": AnthropicProvider,
-    "claude-sonnet-4-0": AnthropicProvider,
+    "claude-3-opus-20240229": "anthropic",
+    "claude-3-sonnet-20240229": "anthropic",
+    "claude-3-haiku-20240307": "anthropic",
+    "claude-3-5-sonnet-latest": "anthropic",
+    "claude-sonnet-4-5": "anthropic",
+    "claude-sonnet-4-0": "anthropic",
     
     # Google models - Gemini 3 (2025)
-    "gemini-flash-latest": GoogleProvider,  # Latest Flash with Google Search
-    "gemini-pro-latest": GoogleProvider,    # Latest Pro model
-    "gemini-3-pro": GoogleProvider,       # Most intelligent, best multimodal
+    "gemini-flash-latest": "google",  # Latest Flash with Google Search
+    "gemini-pro-latest": "google",    # Latest Pro model
+    "gemini-3-pro": "google",         # Most intelligent, best multimodal
     # Google models - Gemini 2.5
-    "gemini-2.5-pro": GoogleProvider,     # Powerful reasoning, coding
-    "gemini-2.5-flash": GoogleProvider,   # Balanced, 1M token context
-    "gemini-2.5-flash-lite": GoogleProvider,  # Fastest, cost-efficient
+    "gemini-2.5-pro": "google",         # Powerful reasoning, coding
+    "gemini-2.5-flash": "google",       # Balanced, 1M token context
+    "gemini-2.5-flash-lite": "google",  # Fastest, cost-efficient
     # Google models - Media generation
-    "veo-3.1": GoogleProvider,            # Video generation with audio
-    "nano-banana": GoogleProvider,        # Image generation
-    "nano-banana-pro": GoogleProvider,    # Advanced image generation
+    "veo-3.1": "google",          # Video generation with audio
+    "nano-banana": "google",      # Image generation
+    "nano-banana-pro": "google",  # Advanced image generation
     # Google models - Legacy
-    "gemini-2.0-flash": GoogleProvider,
-    "gemini-1.5-pro": GoogleProvider,
-    "gemini-1.5-flash": GoogleProvider,
-    "gemini-pro": GoogleProvider,
+    "gemini-2.0-flash": "google",
+    "gemini-1.5-pro": "google",
+    "gemini-1.5-flash": "google",
+    "gemini-pro": "google",
     
     # Ollama models (local)
-    "llama3.2": OllamaProvider,
-    "llama3.1": OllamaProvider,
-    "llama3": OllamaProvider,
-    "llama2": OllamaProvider,
-    "mistral": OllamaProvider,
-    "mixtral": OllamaProvider,
-    "codellama": OllamaProvider,
-    "gemma3": OllamaProvider,
-    "gemma2": OllamaProvider,
-    "qwen2.5": OllamaProvider,
-    "deepseek-r1": OllamaProvider,
-    "phi3": OllamaProvider,
+    "llama3.2": "ollama",
+    "llama3.1": "ollama",
+    "llama3": "ollama",
+    "llama2": "ollama",
+    "mistral": "ollama",
+    "mixtral": "ollama",
+    "codellama": "ollama",
+    "gemma3": "ollama",
+    "gemma2": "ollama",
+    "qwen2.5": "ollama",
+    "deepseek-r1": "ollama",
+    "phi3": "ollama",
 }
 
+# Model name prefix -> provider, for models missing from the map above
+_PROVIDER_PREFIXES = (
+    ("gpt", "openai"),
+    ("claude", "anthropic"),
+    ("gemini", "google"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_provider(name: str) -> Type[BaseLLMProvider]:
+    """Import a provider module and return its provider class."""
+    module_name, class_name = _PROVIDERS[name]
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
+
 
 class LLMFactory:
     """
@@ -77,24 +100,23 @@ class LLMFactory:
     """
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_provider_class(model_name: str) -> Type[BaseLLMProvider]:
-        """Get the provider class for a model."""
+        """Get the provider class for a model. Results are memoized per name."""
         model_lower = model_name.lower()
         
         # Direct lookup
-        if model_lower in MODEL_PROVIDER_MAP:
-            return MODEL_PROVIDER_MAP[model_lower]
+        provider_name = MODEL_PROVIDER_MAP.get(model_lower)
+        if provider_name is not None:
+            return _load_provider(provider_name)
         
         # Prefix matching
-        if model_lower.startswith("gpt"):
-            return OpenAIProvider
-        elif model_lower.startswith("claude"):
-            return AnthropicProvider
-        elif model_lower.startswith("gemini"):
-            return GoogleProvider
-        else:
-            # Default to Ollama for unknown models (assume local)
-            return OllamaProvider
+        for prefix, provider_name in _PROVIDER_PREFIXES:
+            if model_lower.startswith(prefix):
+                return _load_provider(provider_name)
+        
+        # Default to Ollama for unknown models (assume local)
+        return _load_provider("ollama")
     
     @staticmethod
     def create(
@@ -103,6 +125,7 @@ class LLMFactory:
         base_url: Optional[str] = None,
         temperature: float = 0.0,
         streaming: bool = True,
+        cache: Optional[CacheProvider] = None,
         **kwargs
     ) -> BaseLLMProvider:
         """
@@ -114,6 +137,7 @@ class LLMFactory:
             base_url: Optional base URL (for Ollama)
             temperature: Temperature setting
             streaming: Enable streaming
+            cache: Optional cache for deterministic (temperature 0) completions
             **kwargs: Additional config options
             
         Returns:
@@ -130,7 +154,7 @@ class LLMFactory:
             **kwargs
         )
         
-        provider = provider_class(config)
+        provider = provider_class(config, cache=cache)
         provider.initialize()
         
         return provider
@@ -139,10 +163,8 @@ class LLMFactory:
     def list_supported_models() -> Dict[str, list]:
         """List all supported models by provider."""
         return {
-            "openai": OpenAIProvider.SUPPORTED_MODELS,
-            "anthropic": AnthropicProvider.SUPPORTED_MODELS,
-            "google": GoogleProvider.SUPPORTED_MODELS,
-            "ollama": OllamaProvider.SUPPORTED_MODELS,
+            name: _load_provider(name).SUPPORTED_MODELS
+            for name in _PROVIDERS
         }
 
 
@@ -1,12 +1,13 @@
 """Google LLM provider (Gemini)."""
 
-from typing import Optional, List, Callable, AsyncIterator
+from typing import Optional, List, Dict, Any, Tuple, Callable, AsyncIterator
 import os
 
 from google import genai
 from google.genai import types
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, _http2_available
+from .stream_buffer import StreamBuffer
 from ...core.interfaces.llm_provider import LLMConfig, LLMResponse
 
 
@@ -62,18 +63,25 @@ class GoogleProvider(BaseLLMProvider):
         """Initialize the Google AI client using new genai.Client() API."""
         try:
             # Prefer GOOGLE_API_KEY, then GEMINI_API_KEY
-            api_key = self.config.api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+            self._api_key = self.config.api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
             
-            if not api_key:
+            if not self._api_key:
                 raise ValueError("GEMINI_API_KEY or GOOGLE_API_KEY environment variable not set")
             
             # New Client-based API (2025)
-            self._client = genai.Client(api_key=api_key)
+            # HTTP/2 multiplexes concurrent requests over one connection.
+            # Async calls go through aiohttp when it is installed, which
+            # doesn't take httpx arguments, so only the sync client is set.
+            http_options = None
+            if _http2_available():
+                http_options = types.HttpOptions(client_args={"http2": True})
+            
+            self._client = genai.Client(api_key=self._api_key, http_options=http_options)
             self._model_name = self.config.model_name
         except ImportError:
             raise ImportError("google-genai package not installed. Run: pip install google-genai")
     
-    def complete(
+    def _complete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -83,34 +91,7 @@ class GoogleProvider(BaseLLMProvider):
         if self._client is None:
             self.initialize()
         
-        # Build content with proper types
-        user_message = prompt
-        if system_prompt:
-            user_message = f"{system_prompt}\n\n{prompt}"
-        
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part.from_text(text=user_message),
-                ],
-            ),
-        ]
-        
-        # Add Google Search tool
-        tools = [
-            types.Tool(googleSearch=types.GoogleSearch()),
-        ]
-        
-        # Configure generation with thinking and Google Search
-        config = types.GenerateContentConfig(
-            temperature=kwargs.get("temperature", self.config.temperature),
-            max_output_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            tools=tools,
-            thinking_config=types.ThinkingConfig(
-                thinking_budget=-1,  # Unlimited thinking
-            ) if kwargs.get("enable_thinking", True) else None,
-        )
+        contents, config = self._build_request(prompt, system_prompt, kwargs)
         
         # Generate content
         response = self._client.models.generate_content(
@@ -119,17 +100,7 @@ class GoogleProvider(BaseLLMProvider):
             config=config
         )
         
-        # Extract token usage if available
-        tokens_used = 0
-        if hasattr(response, 'usage_metadata'):
-            tokens_used = getattr(response.usage_metadata, 'total_token_count', 0)
-        
-        return LLMResponse(
-            content=response.text,
-            model=self._model_name,
-            tokens_used=tokens_used,
-            finish_reason="stop",
-        )
+        return self._to_response(response)
     
     def stream(
         self,
@@ -142,58 +113,46 @@ class GoogleProvider(BaseLLMProvider):
         if self._client is None:
             self.initialize()
         
-        # Build content with proper types
-        user_message = prompt
-        if system_prompt:
-            user_message = f"{system_prompt}\n\n{prompt}"
-        
-        contents = [
-            types.Content(
-                role="user",
-                parts=[
-                    types.Part.from_text(text=user_message),
-                ],
-            ),
-        ]
-        
-        # Add Google Search tool
-        tools = [
-            types.Tool(googleSearch=types.GoogleSearch()),
-        ]
-        
-        # Configure generation
-        config = types.GenerateContentConfig(
-            temperature=kwargs.get("temperature", self.config.temperature),
-            max_output_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            tools=tools,
-            thinking_config=types.ThinkingConfig(
-                thinking_budget=-1,
-            ) if kwargs.get("enable_thinking", True) else None,
-        )
+        contents, config = self._build_request(prompt, system_prompt, kwargs)
         
         # Stream content
-        full_content = ""
+        parts: List[str] = []
+        buffer = StreamBuffer(callback) if callback else None
         for chunk in self._client.models.generate_content_stream(
             model=self._model_name,
             contents=contents,
             config=config
         ):
-            if hasattr(chunk, 'text') and chunk.text:
-                full_content += chunk.text
-                if callback:
-                    callback(chunk.text)
+            text = chunk.text
+            if text:
+                parts.append(text)
+                if buffer:
+                    buffer.push(text)
+        
+        if buffer:
+            buffer.flush()
         
-        return full_content
+        return "".join(parts)
     
-    async def acomplete(
+    async def _acomplete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
-        """Async completion."""
-        # Google's SDK doesn't have native async, run sync version
-        return self.complete(prompt, system_prompt, **kwargs)
+        """Async completion using client.aio.models.generate_content()."""
+        if self._client is None:
+            self.initialize()
+        
+        contents, config = self._build_request(prompt, system_prompt, kwargs)
+        
+        response = await self._client.aio.models.generate_content(
+            model=self._model_name,
+            contents=contents,
+            config=config
+        )
+        
+        return self._to_response(response)
     
     async def astream(
         self,
@@ -222,8 +181,70 @@ class GoogleProvider(BaseLLMProvider):
         )
         
         async for chunk in response:
-            if hasattr(chunk, 'text') and chunk.text:
-                yield chunk.text
+            text = chunk.text
+            if text:
+                yield text
+    
+    async def aclose(self) -> None:
+        """Close the Gemini client's async session, if one was created."""
+        if self._client is not None:
+            await self._client.aio.aclose()
+            # A new client is created on the next call
+            self._client = None
+        await super().aclose()
+    
+    def _build_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[List[types.Content], types.GenerateContentConfig]:
+        """Build the contents and generation config shared by all completion methods."""
+        # Build content with proper types
+        user_message = prompt
+        if system_prompt:
+            user_message = f"{system_prompt}\n\n{prompt}"
+        
+        contents = [
+            types.Content(
+                role="user",
+                parts=[
+                    types.Part.from_text(text=user_message),
+                ],
+            ),
+        ]
+        
+        # Add Google Search tool
+        tools = [
+            types.Tool(googleSearch=types.GoogleSearch()),
+        ]
+        
+        # Configure generation with thinking and Google Search
+        config = types.GenerateContentConfig(
+            temperature=kwargs.get("temperature", self.config.temperature),
+            max_output_tokens=kwargs.get("max_tokens", self.config.max_tokens),
+            tools=tools,
+            thinking_config=types.ThinkingConfig(
+                thinking_budget=-1,  # Unlimited thinking
+            ) if kwargs.get("enable_thinking", True) else None,
+        )
+        
+        return contents, config
+    
+    def _to_response(self, response) -> LLMResponse:
+        """Convert a generate_content() response to an LLMResponse."""
+        # Extract token usage if available
+        try:
+            tokens_used = response.usage_metadata.total_token_count or 0
+        except AttributeError:
+            tokens_used = 0
+        
+        return LLMResponse(
+            content=response.text,
+            model=self._model_name,
+            tokens_used=tokens_used,
+            finish_reason="stop",
+        )
     
     def _create_langchain_llm(self):
         """Create LangChain Google instance."""
@@ -1,9 +1,11 @@
 """Ollama LLM provider for local models."""
 
-from typing import Optional, List, Callable, AsyncIterator
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator
 import os
 
 from .base import BaseLLMProvider
+from .stream_buffer import StreamBuffer
+from ...core.interfaces.cache import CacheProvider
 from ...core.interfaces.llm_provider import LLMConfig, LLMResponse
 
 
@@ -29,6 +31,17 @@ class OllamaProvider(BaseLLMProvider):
         "phi3",
     ]
     
+    # How long the server keeps the model loaded after a request, so
+    # consecutive calls don't wait for the weights to load again
+    KEEP_ALIVE = "10m"
+    
+    def __init__(self, config: LLMConfig, cache: Optional[CacheProvider] = None):
+        super().__init__(config, cache)
+        # Add :latest suffix if not present
+        model_name = config.model_name
+        self._resolved_model = model_name if ":" in model_name else f"{model_name}:latest"
+        self._base_url = config.base_url or os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434")
+    
     @property
     def provider_name(self) -> str:
         return "ollama"
@@ -42,15 +55,13 @@ class OllamaProvider(BaseLLMProvider):
         try:
             import ollama
             
-            base_url = self.config.base_url or os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434")
-            
-            # Set the host
-            self._base_url = base_url
             self._client = ollama
+            # Created once so async calls share one connection pool
+            self._async_client = ollama.AsyncClient(host=self._base_url)
         except ImportError:
             raise ImportError("ollama package not installed. Run: pip install ollama")
     
-    def complete(
+    def _complete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -62,17 +73,12 @@ class OllamaProvider(BaseLLMProvider):
         
         messages = self._build_messages(prompt, system_prompt)
         
-        # Add :latest suffix if not present
-        model_name = self.config.model_name
-        if ":" not in model_name:
-            model_name = f"{model_name}:latest"
+        model_name = self._resolved_model
         
         response = self._client.chat(
             model=model_name,
             messages=messages,
-            options={
-                "temperature": kwargs.get("temperature", self.config.temperature),
-            }
+            **self._build_chat_kwargs(kwargs)
         )
         
         return LLMResponse(
@@ -97,50 +103,47 @@ class OllamaProvider(BaseLLMProvider):
         
         messages = self._build_messages(prompt, system_prompt)
         
-        model_name = self.config.model_name
-        if ":" not in model_name:
-            model_name = f"{model_name}:latest"
+        model_name = self._resolved_model
         
-        full_content = ""
+        parts: List[str] = []
+        buffer = StreamBuffer(callback) if callback else None
         
         stream = self._client.chat(
             model=model_name,
             messages=messages,
-            options={
-                "temperature": kwargs.get("temperature", self.config.temperature),
-            },
+            **self._build_chat_kwargs(kwargs),
             stream=True
         )
         
         for chunk in stream:
             content = chunk['message']['content']
-            full_content += content
-            if callback:
-                callback(content)
+            parts.append(content)
+            if buffer:
+                buffer.push(content)
+        
+        if buffer:
+            buffer.flush()
         
-        return full_content
+        return "".join(parts)
     
-    async def acomplete(
+    async def _acomplete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Async completion."""
-        import ollama
+        if self._async_client is None:
+            self.initialize()
         
         messages = self._build_messages(prompt, system_prompt)
         
-        model_name = self.config.model_name
-        if ":" not in model_name:
-            model_name = f"{model_name}:latest"
+        model_name = self._resolved_model
         
-        response = await ollama.AsyncClient().chat(
+        response = await self._async_client.chat(
             model=model_name,
             messages=messages,
-            options={
-                "temperature": kwargs.get("temperature", self.config.temperature),
-            }
+            **self._build_chat_kwargs(kwargs)
         )
         
         return LLMResponse(
@@ -159,38 +162,41 @@ class OllamaProvider(BaseLLMProvider):
         **kwargs
     ) -> AsyncIterator[str]:
         """Async streaming."""
-        import ollama
+        if self._async_client is None:
+            self.initialize()
         
         messages = self._build_messages(prompt, system_prompt)
         
-        model_name = self.config.model_name
-        if ":" not in model_name:
-            model_name = f"{model_name}:latest"
+        model_name = self._resolved_model
         
-        async for chunk in await ollama.AsyncClient().chat(
+        async for chunk in await self._async_client.chat(
             model=model_name,
             messages=messages,
-            options={
-                "temperature": kwargs.get("temperature", self.config.temperature),
-            },
+            **self._build_chat_kwargs(kwargs),
             stream=True
         ):
             yield chunk['message']['content']
     
+    def _build_chat_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the chat() arguments shared by all completion methods."""
+        return {
+            "options": {
+                "temperature": kwargs.get("temperature", self.config.temperature),
+            },
+            "keep_alive": kwargs.get("keep_alive", self.KEEP_ALIVE),
+        }
+    
     def _create_langchain_llm(self):
         """Create LangChain Ollama instance."""
         from langchain_ollama import ChatOllama
         
-        base_url = self.config.base_url or os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434")
-        
-        model_name = self.config.model_name
-        if ":" not in model_name:
-            model_name = f"{model_name}:latest"
+        model_name = self._resolved_model
         
         return ChatOllama(
             model=model_name,
-            base_url=base_url,
+            base_url=self._base_url,
             temperature=self.config.temperature,
+            keep_alive=self.KEEP_ALIVE,
         )
     
     def list_models(self) -> List[str]:
@@ -3,7 +3,8 @@
 from typing import Optional, List, Callable, AsyncIterator
 import os
 
-from .base import BaseLLMProvider
+from .base import BaseLLMProvider, _http2_available
+from .stream_buffer import StreamBuffer
 from ...core.interfaces.llm_provider import LLMConfig, LLMResponse
 
 
@@ -55,18 +56,28 @@ class OpenAIProvider(BaseLLMProvider):
     def initialize(self) -> None:
         """Initialize the OpenAI client."""
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
             
-            api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
+            self._api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
+            
+            # HTTP/2 multiplexes concurrent requests over one connection
+            http2 = _http2_available()
             
             self._client = OpenAI(
-                api_key=api_key,
+                api_key=self._api_key,
+                timeout=self.config.timeout,
+                http_client=DefaultHttpxClient(http2=True) if http2 else None,
+            )
+            # Created once so async calls share one connection pool
+            self._async_client = AsyncOpenAI(
+                api_key=self._api_key,
                 timeout=self.config.timeout,
+                http_client=DefaultAsyncHttpxClient(http2=True) if http2 else None,
             )
         except ImportError:
             raise ImportError("openai package not installed. Run: pip install openai")
     
-    def complete(
+    def _complete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -97,21 +108,26 @@ class OpenAIProvider(BaseLLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Use new responses.create() API (2025)."""
-        full_input = prompt
-        if system_prompt:
-            full_input = f"{system_prompt}\n\n{prompt}"
+        # Pass the system prompt as instructions rather than prepending it
+        # to the input, so the request keeps a stable, cacheable prefix
+        extra = {"instructions": system_prompt} if system_prompt else {}
         
         response = self._client.responses.create(
             model=self.config.model_name,
-            input=full_input,
+            input=prompt,
             temperature=kwargs.get("temperature", self.config.temperature),
             max_output_tokens=kwargs.get("max_tokens", self.config.max_tokens),
+            **extra,
         )
         
+        usage = getattr(response, "usage", None)
+        
         return LLMResponse(
             content=response.output_text or "",
             model=self.config.model_name,
-            tokens_used=getattr(response, 'usage', {}).get('total_tokens', 0) if hasattr(response, 'usage') else 0,
+            tokens_used=usage.total_tokens if usage else 0,
+            prompt_tokens=usage.input_tokens if usage else 0,
+            completion_tokens=usage.output_tokens if usage else 0,
             finish_reason="stop",
         )
     
@@ -164,31 +180,35 @@ class OpenAIProvider(BaseLLMProvider):
             stream=True,
         )
         
-        full_content = ""
-        for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                content = chunk.choices[0].delta.content
-                full_content += content
-                if callback:
-                    callback(content)
+        parts: List[str] = []
+        buffer = StreamBuffer(callback) if callback else None
+        # Close the HTTP response even if a callback raises
+        with response:
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content = chunk.choices[0].delta.content
+                    parts.append(content)
+                    if buffer:
+                        buffer.push(content)
+        
+        if buffer:
+            buffer.flush()
         
-        return full_content
+        return "".join(parts)
     
-    async def acomplete(
+    async def _acomplete(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Async completion."""
-        from openai import AsyncOpenAI
-        
-        api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
-        client = AsyncOpenAI(api_key=api_key)
+        if self._async_client is None:
+            self.initialize()
         
         messages = self._build_messages(prompt, system_prompt)
         
-        response = await client.chat.completions.create(
+        response = await self._async_client.chat.completions.create(
             model=self.config.model_name,
             messages=messages,
             temperature=kwargs.get("temperature", self.config.temperature),
@@ -213,14 +233,12 @@ class OpenAIProvider(BaseLLMProvider):
         **kwargs
     ) -> AsyncIterator[str]:
         """Async streaming."""
-        from openai import AsyncOpenAI
-        
-        api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
-        client = AsyncOpenAI(api_key=api_key)
+        if self._async_client is None:
+            self.initialize()
         
         messages = self._build_messages(prompt, system_prompt)
         
-        response = await client.chat.completions.create(
+        response = await self._async_client.chat.completions.create(
             model=self.config.model_name,
             messages=messages,
             temperature=kwargs.get("temperature", self.config.temperature),
@@ -228,9 +246,13 @@ class OpenAIProvider(BaseLLMProvider):
             stream=True,
         )
         
-        async for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        # Close the HTTP response even if the consumer stops iterating early
+        try:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await response.close()
     
     def _create_langchain_llm(self):
         """Create LangChain OpenAI instance."""
@@ -0,0 +1,56 @@
+"""Coalescing of streamed LLM output before it reaches callbacks."""
+
+import time
+from typing import Callable, List
+
+
+class StreamBuffer:
+    """
+    Batch streamed text chunks before passing them to a callback.
+    
+    Models can emit hundreds of tiny chunks per second, and stream
+    callbacks usually do UI work. Chunks are buffered and handed over
+    together once enough text has accumulated or enough time has passed
+    since the last flush. Call flush() when the stream ends.
+    """
+    
+    def __init__(
+        self,
+        callback: Callable[[str], None],
+        max_chars: int = 8192,
+        max_interval: float = 0.025
+    ):
+        """
+        Initialize the buffer.
+        
+        Args:
+            callback: Function to call with each batch of text
+            max_chars: Flush once this many characters are buffered
+            max_interval: Flush once this many seconds have passed
+                since the last flush
+        """
+        self._callback = callback
+        self._max_chars = max_chars
+        self._max_interval = max_interval
+        self._parts: List[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+    
+    def push(self, text: str) -> None:
+        """Add a chunk of text, flushing if a threshold is reached."""
+        self._parts.append(text)
+        self._size += len(text)
+        
+        if (
+            self._size >= self._max_chars
+            or time.monotonic() - self._last_flush >= self._max_interval
+        ):
+            self.flush()
+    
+    def flush(self) -> None:
+        """Pass any buffered text to the callback."""
+        if self._parts:
+            self._callback("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        self._last_flush = time.monotonic()
@@ -1,16 +1,67 @@
 """Ahmia search engine adapter."""
 
-from typing import List
-from urllib.parse import quote_plus
+from typing import Iterator, List, Optional, Union
 from datetime import datetime, timezone
+from html import unescape
+from itertools import islice
 import re
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .base import BaseSearchEngine
+from .base import BaseSearchEngine, HTML_PARSER, encode_query, has_class
 from ...core.entities.search_result import SearchResult
 
 
+# Only result items are built into the parse tree
+_RESULT_STRAINER = SoupStrainer("li", class_=has_class("result"))
+
+# Markup the fast parser expects around each result
+_RESULT_OPEN = '<li class="result">'
+_UPDATED_OPEN = '<span class="updated">'
+
+# Tags that would implicitly close a <p> or <a> in an HTML parser
+_BLOCK_TAGS = ("<a", "<p", "<div", "<ul", "<ol", "<li", "<table", "<h")
+
+# Tags whose content an HTML parser reads as text rather than markup
+_RAW_TEXT_TAGS = ("<script", "<style", "<textarea", "<title", "<xmp", "<noscript", "<iframe", "<noembed")
+
+# Upper or mixed case tag or attribute names, which HTML parsers treat
+# as lower case but the fast parser's str.find() calls wouldn't match
+_UPPERCASE_MARKUP = re.compile(r"<[/!]?[a-z]*[A-Z]|\s[a-z-]*[A-Z][A-Za-z-]*\s*=")
+
+
+def _find_tag(markup: str, name: str, start: int = 0) -> int:
+    """Find the next start tag named exactly name, or -1."""
+    open_tag = "<" + name
+    index = markup.find(open_tag, start)
+    while index != -1:
+        following = markup[index + len(open_tag):index + len(open_tag) + 1]
+        if following in (" ", ">", "/", "\t", "\n", "\r"):
+            return index
+        index = markup.find(open_tag, index + 1)
+    return -1
+
+
+def _text(fragment: str) -> Optional[str]:
+    """
+    Extract text from a markup fragment like get_text(strip=True).
+    
+    Returns None if a tag in the fragment isn't closed.
+    """
+    parts = []
+    pos = 0
+    while True:
+        lt = fragment.find("<", pos)
+        chunk = unescape(fragment[pos:] if lt == -1 else fragment[pos:lt]).strip()
+        if chunk:
+            parts.append(chunk)
+        if lt == -1:
+            return "".join(parts)
+        pos = fragment.find(">", lt) + 1
+        if pos == 0:
+            return None
+
+
 class AhmiaSearchEngine(BaseSearchEngine):
     """
     Ahmia search engine adapter.
@@ -29,14 +80,35 @@ class AhmiaSearchEngine(BaseSearchEngine):
     
     def build_search_url(self, query: str) -> str:
         """Build the search URL for Ahmia."""
-        encoded_query = quote_plus(query)
+        encoded_query = encode_query(query)
         return f"{self.base_url}/search/?q={encoded_query}"
     
-    def _parse_results(self, html: str, query: str) -> List[SearchResult]:
+    # Scan Ahmia's fixed result markup with str.find instead of building
+    # a parse tree. Pages it isn't sure about go to BeautifulSoup.
+    _use_fast_parser = True
+    
+    def _parse_results(self, html: Union[str, bytes], query: str) -> Iterator[SearchResult]:
         """Parse Ahmia search results."""
-        results = []
+        # raw_html is the re-serialized tree, so it needs the soup
+        if self._use_fast_parser and not self._include_raw_html:
+            results = self._parse_results_fast(html, query)
+            if results is not None:
+                return iter(results)
         
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_results_soup(html, query)
+    
+    def _collect_results(self, html: Union[str, bytes], query: str, max_results: int) -> List[SearchResult]:
+        """Parse up to max_results results, stopping the fast parser there too."""
+        if self._use_fast_parser and not self._include_raw_html:
+            results = self._parse_results_fast(html, query, max_results)
+            if results is not None:
+                return results
+        
+        return list(islice(self._parse_results_soup(html, query), max_results))
+    
+    def _parse_results_soup(self, html: Union[str, bytes], query: str) -> Iterator[SearchResult]:
+        """Parse Ahmia search results with BeautifulSoup."""
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_RESULT_STRAINER)
         
         # Find result containers
         result_items = soup.find_all("li", class_="result")
@@ -71,7 +143,7 @@ class AhmiaSearchEngine(BaseSearchEngine):
                     except ValueError:
                         pass
                 
-                result = SearchResult(
+                yield SearchResult(
                     id=self._generate_result_id(url),
                     url=url,
                     title=title,
@@ -79,14 +151,133 @@ class AhmiaSearchEngine(BaseSearchEngine):
                     source_engine=self.engine_name,
                     query=query,
                     discovered_at=discovered_at or datetime.now(timezone.utc),
-                    raw_html=str(item),
+                    raw_html=str(item) if self._include_raw_html else None,
                 )
                 
-                results.append(result)
-                
             except Exception as e:
                 self._logger.warning(f"Failed to parse result: {e}")
                 continue
+    
+    def _parse_results_fast(
+        self,
+        html: Union[str, bytes],
+        query: str,
+        max_results: Optional[int] = None
+    ) -> Optional[List[SearchResult]]:
+        """
+        Parse Ahmia search results by scanning for their known markup.
+        
+        Gives the same results as the BeautifulSoup parser for pages in
+        Ahmia's usual format, and None for anything else (comments,
+        nested or unclosed tags, upper case markup, other class
+        attributes, non-UTF-8 bytes) so the caller can fall back to it.
+        Stops after max_results results, if given.
+        """
+        if isinstance(html, bytes):
+            try:
+                html = html.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+        
+        start = html.find(_RESULT_OPEN)
+        # Items with extra classes need the soup's class matching
+        if start == -1 or html.count(_RESULT_OPEN) != html.count('class="result'):
+            return None
+        # Everything before the first result is outside the items
+        if _UPPERCASE_MARKUP.search(html, start):
+            return None
+        
+        results = []
+        while start != -1 and (max_results is None or len(results) < max_results):
+            body_start = start + len(_RESULT_OPEN)
+            end = html.find("</li>", body_start)
+            if end == -1:
+                return None
+            item = html[body_start:end]
+            if "<li" in item or "<!--" in item or any(tag in item for tag in _RAW_TEXT_TAGS):
+                return None
+            
+            # Extract URL
+            link_start = _find_tag(item, "a")
+            if link_start == -1:
+                start = html.find(_RESULT_OPEN, end)
+                continue
+            tag_end = item.find(">", link_start)
+            if tag_end == -1:
+                return None
+            tag = item[link_start:tag_end]
+            # An odd quote count means a ">" inside an attribute value
+            if tag.count('"') % 2 or "'" in tag:
+                return None
+            href = tag.find(' href="')
+            if href == -1:
+                if "href" in tag:
+                    return None
+                url = ""
+            else:
+                href += len(' href="')
+                url = unescape(tag[href:tag.find('"', href)])
+            
+            # Extract title
+            link_end = item.find("</a>", tag_end)
+            if link_end == -1:
+                return None
+            link_text = item[tag_end + 1:link_end]
+            if any(block in link_text for block in _BLOCK_TAGS):
+                return None
+            title = _text(link_text)
+            if title is None:
+                return None
+            if not title:
+                title = "Untitled"
+            
+            # Extract description/snippet
+            description = ""
+            para_start = _find_tag(item, "p")
+            if para_start != -1:
+                para_tag_end = item.find(">", para_start)
+                para_end = item.find("</p>", para_tag_end)
+                if para_tag_end == -1 or para_end == -1:
+                    return None
+                para_text = item[para_tag_end + 1:para_end]
+                if any(block in para_text for block in _BLOCK_TAGS):
+                    return None
+                description = _text(para_text)
+                if description is None:
+                    return None
+            
+            # Extract date if available
+            discovered_at = None
+            date_start = item.find(_UPDATED_OPEN)
+            if date_start == -1:
+                if "updated" in item:
+                    return None
+            else:
+                # Any earlier "updated" may be a span with more classes
+                if item.find("updated") != date_start + len('<span class="'):
+                    return None
+                date_start += len(_UPDATED_OPEN)
+                date_end = item.find("</span>", date_start)
+                if date_end == -1:
+                    return None
+                date_text = _text(item[date_start:date_end])
+                try:
+                    discovered_at = datetime.strptime(date_text, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+                except (TypeError, ValueError):
+                    pass
+            
+            results.append(SearchResult(
+                id=self._generate_result_id(url),
+                url=url,
+                title=title,
+                description=description,
+                source_engine=self.engine_name,
+                query=query,
+                discovered_at=discovered_at or datetime.now(timezone.utc),
+                raw_html=None,
+            ))
+            
+            start = html.find(_RESULT_OPEN, end)
         
         return results
 
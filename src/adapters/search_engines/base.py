@@ -1,15 +1,110 @@
 """Base search engine adapter with common functionality."""
 
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator, Union
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import islice
+from urllib.parse import quote_plus
+import asyncio
+import functools
 import logging
 import hashlib
+import time
 
 from ...core.interfaces.search_engine import SearchEngineProvider
 from ...core.entities.search_result import SearchResult
 
+# BeautifulSoup tree builder for result pages. lxml's C parser is much
+# faster than the pure Python html.parser on large pages.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+@functools.lru_cache(maxsize=1024)
+def encode_query(query: str) -> str:
+    """
+    URL-encode a search query for use in a query string.
+    
+    Memoized, since the manager sends the same query to every engine.
+    """
+    return quote_plus(query)
+
+
+def has_class(*class_names: str):
+    """
+    Build a SoupStrainer attribute matcher for any of the given classes.
+    
+    Unlike find_all(class_=...), a SoupStrainer compares the whole
+    class attribute, so "result highlighted" wouldn't match "result".
+    
+    Args:
+        *class_names: CSS class names to accept
+        
+    Returns:
+        Function to pass as a SoupStrainer's class_ argument
+    """
+    wanted = frozenset(class_names)
+    
+    def match(value) -> bool:
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return not wanted.isdisjoint(classes)
+    
+    return match
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logger(engine_name: str) -> logging.Logger:
+    """Get an engine's logger, skipping logging's lock once looked up."""
+    return logging.getLogger(f"robin.search.{engine_name}")
+
+
+def _session_retries(session, url: str) -> bool:
+    """Whether a requests session's adapter for url retries failed requests."""
+    try:
+        retries = session.get_adapter(url).max_retries
+    except Exception:
+        return False
+    return bool(getattr(retries, "total", 0))
+
+
+# Connection limits for async clients created by the engines
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+ASYNC_KEEPALIVE_EXPIRY = 30.0
+
+
+def create_async_client(proxy: Optional[str] = None, timeout: float = 30):
+    """
+    Create an httpx.AsyncClient for concurrent engine searches.
+    
+    Share one client between engines so that they share its
+    connection pool, and close it with ``await client.aclose()``.
+    
+    Args:
+        proxy: Optional proxy URL, e.g. the Tor SOCKS proxy
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    import httpx
+    
+    return httpx.AsyncClient(
+        proxy=proxy,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=ASYNC_KEEPALIVE_EXPIRY,
+        ),
+    )
+
 
 @dataclass
 class SearchEngineStatus:
@@ -33,13 +128,20 @@ class BaseSearchEngine(SearchEngineProvider):
         session=None,
         timeout: int = 30,
         max_retries: int = 3,
-        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/109.0"
+        user_agent: str = "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/109.0",
+        include_raw_html: bool = False,
+        async_client=None
     ):
         self._session = session
+        self._async_client = async_client
+        self._owns_async_client = False
+        self._async_client_loop = None
         self._timeout = timeout
         self._max_retries = max_retries
         self._user_agent = user_agent
-        self._logger = logging.getLogger(f"robin.search.{self.engine_name}")
+        # Serializing every result's HTML is costly and rarely needed
+        self._include_raw_html = include_raw_html
+        self._logger = _get_logger(self.engine_name)
         self._last_status: Optional[SearchEngineStatus] = None
     
     @property
@@ -73,9 +175,24 @@ class BaseSearchEngine(SearchEngineProvider):
         """Set the HTTP session to use."""
         self._session = session
     
+    def set_async_client(self, client) -> None:
+        """Set the httpx.AsyncClient to use for async searches."""
+        self._async_client = client
+        self._owns_async_client = False
+    
+    async def aclose(self) -> None:
+        """Close the async client if this engine created it."""
+        if self._owns_async_client:
+            # One from a finished event loop can only be dropped
+            if self._async_client_loop is asyncio.get_running_loop():
+                await self._async_client.aclose()
+            self._async_client = None
+            self._owns_async_client = False
+            self._async_client_loop = None
+    
     def _generate_result_id(self, url: str) -> str:
-        """Generate a unique ID for a result."""
-        return hashlib.sha256(url.encode()).hexdigest()[:16]
+        """Generate a unique ID for a result (16 hex characters)."""
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
     
     def _make_request(
         self,
@@ -83,13 +200,21 @@ class BaseSearchEngine(SearchEngineProvider):
         params: Optional[dict] = None,
         method: str = "GET"
     ):
-        """Make an HTTP request with retry logic."""
+        """
+        Make an HTTP request with retry logic.
+        
+        Sessions from create_session() retry in their transport adapter,
+        which backs off between attempts, so they get a single call here.
+        Other sessions (e.g. TorManager.get_session()) are retried up to
+        max_retries times.
+        """
         if self._session is None:
             raise RuntimeError("No HTTP session configured. Call set_session() first.")
         
         headers = {"User-Agent": self._user_agent}
+        attempts = 1 if _session_retries(self._session, url) else self._max_retries
         
-        for attempt in range(self._max_retries):
+        for attempt in range(attempts):
             try:
                 if method.upper() == "GET":
                     response = self._session.get(
@@ -109,6 +234,42 @@ class BaseSearchEngine(SearchEngineProvider):
                 response.raise_for_status()
                 return response
                 
+            except Exception as e:
+                self._logger.warning(
+                    f"Request attempt {attempt + 1}/{attempts} failed: {e}"
+                )
+                if attempt == attempts - 1:
+                    raise
+        
+        return None
+    
+    async def _amake_request(self, url: str):
+        """Make an async HTTP GET request with retry logic."""
+        loop = asyncio.get_running_loop()
+        # A client created under an earlier asyncio.run() is tied to its
+        # closed loop, so it can neither be used nor closed from this one
+        if self._owns_async_client and self._async_client_loop is not loop:
+            self._async_client = None
+            self._owns_async_client = False
+        if self._async_client is None:
+            # Route through the same proxy as the sync session, if any
+            proxy = self._session.proxies.get("http") if self._session is not None else None
+            self._async_client = create_async_client(proxy, self._timeout)
+            self._owns_async_client = True
+            self._async_client_loop = loop
+        
+        headers = {"User-Agent": self._user_agent}
+        
+        for attempt in range(self._max_retries):
+            try:
+                response = await self._async_client.get(
+                    url,
+                    headers=headers,
+                    timeout=self._timeout
+                )
+                response.raise_for_status()
+                return response
+                
             except Exception as e:
                 self._logger.warning(
                     f"Request attempt {attempt + 1}/{self._max_retries} failed: {e}"
@@ -118,21 +279,41 @@ class BaseSearchEngine(SearchEngineProvider):
         
         return None
     
+    def prewarm(self) -> None:
+        """
+        Open a pooled connection to the engine ahead of the first search.
+        
+        Sends a HEAD request to base_url so that the proxy/Tor circuit and
+        TLS setup are done before a search needs them. Errors are ignored;
+        the search will simply connect itself.
+        """
+        if self._session is None:
+            return
+        
+        try:
+            self._session.head(
+                self.base_url,
+                headers={"User-Agent": self._user_agent},
+                timeout=self._timeout
+            )
+        except Exception as e:
+            self._logger.debug(f"Prewarming {self.engine_name} failed: {e}")
+    
     def health_check(self) -> bool:
         """Check if the search engine is accessible."""
         try:
-            start_time = datetime.now()
+            start_time = time.monotonic()
             
             response = self._make_request(self.base_url)
             
-            response_time = (datetime.now() - start_time).total_seconds()
+            response_time = time.monotonic() - start_time
             
             is_available = response is not None and response.status_code == 200
             
             self._last_status = SearchEngineStatus(
                 engine_name=self.engine_name,
                 is_available=is_available,
-                last_check=datetime.now(),
+                last_check=datetime.now(timezone.utc),
                 response_time=response_time
             )
             
@@ -142,7 +323,7 @@ class BaseSearchEngine(SearchEngineProvider):
             self._last_status = SearchEngineStatus(
                 engine_name=self.engine_name,
                 is_available=False,
-                last_check=datetime.now(),
+                last_check=datetime.now(timezone.utc),
                 error_message=str(e)
             )
             return False
@@ -151,14 +332,23 @@ class BaseSearchEngine(SearchEngineProvider):
         """Get the last health check status."""
         return self._last_status
     
-    def _parse_results(self, html: str, query: str) -> List[SearchResult]:
+    def _parse_results(self, html: Union[str, bytes], query: str) -> Iterator[SearchResult]:
         """
         Parse HTML response to extract search results.
         
         Override in subclasses to implement engine-specific parsing.
+        Results are yielded so callers can stop once they have enough.
+        
+        Searches pass the raw response bytes, leaving the parser to take
+        the encoding from the page's <meta> charset rather than having
+        the HTTP client guess it from the body.
         """
         raise NotImplementedError("Subclasses must implement _parse_results")
     
+    def _collect_results(self, html: Union[str, bytes], query: str, max_results: int) -> List[SearchResult]:
+        """Parse up to max_results results from a result page."""
+        return list(islice(self._parse_results(html, query), max_results))
+    
     def parse_results(self, html_content: str) -> List[dict]:
         """
         Implements the interface requirement for parse_results.
@@ -187,11 +377,40 @@ class BaseSearchEngine(SearchEngineProvider):
                 self._logger.error(f"No response from {self.engine_name}")
                 return []
             
-            results = self._parse_results(response.text, query)
+            results = self._collect_results(response.content, query, max_results)
+            
+            self._logger.info(f"Found {len(results)} results from {self.engine_name}")
+            
+            return results
+            
+        except Exception as e:
+            self._logger.error(f"Search failed on {self.engine_name}: {e}")
+            return []
+    
+    async def asearch(self, query: str, max_results: int = 50) -> List[SearchResult]:
+        """
+        Execute a search query without blocking the event loop.
+        
+        Parsing runs in a worker thread, so searches on other engines
+        keep making progress while a page is parsed.
+        """
+        self._logger.info(f"Searching '{query}' on {self.engine_name}")
+        
+        try:
+            search_url = self.build_search_url(query)
+            response = await self._amake_request(search_url)
+            
+            if response is None:
+                self._logger.error(f"No response from {self.engine_name}")
+                return []
+            
+            results = await asyncio.to_thread(
+                self._collect_results, response.content, query, max_results
+            )
             
             self._logger.info(f"Found {len(results)} results from {self.engine_name}")
             
-            return results[:max_results]
+            return results
             
         except Exception as e:
             self._logger.error(f"Search failed on {self.engine_name}: {e}")
@@ -1,15 +1,18 @@
 """Excavator search engine adapter."""
 
-from typing import List
-from urllib.parse import quote_plus
+from typing import Iterator, Union
 from datetime import datetime, timezone
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .base import BaseSearchEngine
+from .base import BaseSearchEngine, HTML_PARSER, encode_query, has_class
 from ...core.entities.search_result import SearchResult
 
 
+# Only result containers are built into the parse tree
+_RESULT_STRAINER = SoupStrainer("div", class_=has_class("result", "search-result"))
+
+
 class ExcavatorSearchEngine(BaseSearchEngine):
     """
     Excavator search engine adapter.
@@ -27,14 +30,12 @@ class ExcavatorSearchEngine(BaseSearchEngine):
     
     def build_search_url(self, query: str) -> str:
         """Build the search URL for Excavator."""
-        encoded_query = quote_plus(query)
+        encoded_query = encode_query(query)
         return f"{self.base_url}/search?q={encoded_query}"
     
-    def _parse_results(self, html: str, query: str) -> List[SearchResult]:
+    def _parse_results(self, html: Union[str, bytes], query: str) -> Iterator[SearchResult]:
         """Parse Excavator search results."""
-        results = []
-        
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_RESULT_STRAINER)
         
         # Find result containers (CSS selectors may vary)
         result_items = soup.find_all("div", class_="result") or soup.find_all("div", class_="search-result")
@@ -62,7 +63,7 @@ class ExcavatorSearchEngine(BaseSearchEngine):
                 if description_elem:
                     description = description_elem.get_text(strip=True)
                 
-                result = SearchResult(
+                yield SearchResult(
                     id=self._generate_result_id(url),
                     url=url,
                     title=title,
@@ -70,13 +71,9 @@ class ExcavatorSearchEngine(BaseSearchEngine):
                     source_engine=self.engine_name,
                     query=query,
                     discovered_at=datetime.now(timezone.utc),
-                    raw_html=str(item),
+                    raw_html=str(item) if self._include_raw_html else None,
                 )
                 
-                results.append(result)
-                
             except Exception as e:
                 self._logger.warning(f"Failed to parse result: {e}")
                 continue
-        
-        return results
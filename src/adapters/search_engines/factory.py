@@ -1,7 +1,11 @@
 """Factory for creating search engine instances."""
 
 from typing import List, Optional, Type, Dict
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import BaseSearchEngine
 from .ahmia import AhmiaSearchEngine, AhmiaClearnetEngine
@@ -33,33 +37,96 @@ TOR_ENGINES = [
     "excavator",
 ]
 
+# Connection pools for the shared session: number of hosts to keep pools
+# for, and connections kept open per host. Engines are searched in
+# parallel, so the requests default of 10 per host is easily exhausted.
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 100
+
+# Retry backoff (seconds, doubled per attempt) and the server errors
+# that are worth retrying. Other 4xx responses won't change on retry.
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = (500, 502, 503, 504)
+
+
+def create_session(max_retries: int = 3) -> requests.Session:
+    """
+    Create an HTTP session with connection pooling for search engines.
+    
+    Connections are kept alive and reused across searches, including
+    through a SOCKS proxy when one is set on the session. Close the
+    session (or use it as a context manager) when done with it.
+    
+    Failed connections and 5xx responses are retried by the session
+    itself, with exponential backoff.
+    
+    Args:
+        max_retries: Maximum retries per request
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=frozenset({"GET", "POST"}),
+        # Hand back the last response so raise_for_status() reports it
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/109.0'
+    })
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def _default_session(max_retries: int) -> requests.Session:
+    """Session shared by engines created without one, so its pool is reused."""
+    return create_session(max_retries)
+
 
 def create_search_engines(
     engines: Optional[List[str]] = None,
     session=None,
     timeout: int = 30,
-    max_retries: int = 3
+    max_retries: int = 3,
+    include_raw_html: bool = False,
+    async_client=None,
+    prewarm: bool = False
 ) -> List[BaseSearchEngine]:
     """
     Create search engine instances.
     
     Args:
         engines: List of engine names to create (all if None)
-        session: HTTP session to use (will create one if None)
+        session: HTTP session to use (a shared pooled session if None)
         timeout: Request timeout
         max_retries: Maximum retries per request
+        include_raw_html: Keep each result's HTML in raw_html
+        async_client: httpx.AsyncClient shared by the engines' async
+            searches (see create_async_client)
+        prewarm: Connect to each engine in the background (see
+            prewarm_engines)
         
     Returns:
         List of configured search engine instances
     """
     engine_names = engines or DEFAULT_ENGINES
     
-    # Create a session if not provided
+    # Share one session between calls so connections stay warm
     if session is None:
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/109.0'
-        })
+        session = _default_session(max_retries)
     
     instances = []
     
@@ -72,14 +139,40 @@ def create_search_engines(
         engine = engine_class(
             session=session,
             timeout=timeout,
-            max_retries=max_retries
+            max_retries=max_retries,
+            include_raw_html=include_raw_html,
+            async_client=async_client
         )
         
         instances.append(engine)
     
+    if prewarm:
+        prewarm_engines(instances)
+    
     return instances
 
 
+def prewarm_engines(engines: List[BaseSearchEngine]) -> None:
+    """
+    Connect to search engines in the background.
+    
+    Each engine's first search otherwise pays for the Tor circuit and
+    TLS handshake. Returns immediately; the connections are left in the
+    session's pool for the searches to reuse.
+    
+    Args:
+        engines: Engines to connect to
+    """
+    if not engines:
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=len(engines), thread_name_prefix="prewarm")
+    for engine in engines:
+        executor.submit(engine.prewarm)
+    # Let the requests finish on their own
+    executor.shutdown(wait=False)
+
+
 def register_engine(name: str, engine_class: Type[BaseSearchEngine]) -> None:
     """Register a custom search engine class."""
     SEARCH_ENGINE_REGISTRY[name] = engine_class
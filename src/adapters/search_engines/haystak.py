@@ -1,12 +1,11 @@
 """Haystak search engine adapter."""
 
-from typing import List
-from urllib.parse import quote_plus
+from typing import Iterator, Union
 from datetime import datetime, timezone
 
 from bs4 import BeautifulSoup
 
-from .base import BaseSearchEngine
+from .base import BaseSearchEngine, HTML_PARSER, encode_query
 from ...core.entities.search_result import SearchResult
 
 
@@ -27,14 +26,12 @@ class HaystakSearchEngine(BaseSearchEngine):
     
     def build_search_url(self, query: str) -> str:
         """Build the search URL for Haystak."""
-        encoded_query = quote_plus(query)
+        encoded_query = encode_query(query)
         return f"{self.base_url}/?q={encoded_query}"
     
-    def _parse_results(self, html: str, query: str) -> List[SearchResult]:
+    def _parse_results(self, html: Union[str, bytes], query: str) -> Iterator[SearchResult]:
         """Parse Haystak search results."""
-        results = []
-        
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         # Find result containers
         result_items = soup.find_all("div", class_="search-result")
@@ -64,7 +61,7 @@ class HaystakSearchEngine(BaseSearchEngine):
                 if description_elem:
                     description = description_elem.get_text(strip=True)
                 
-                result = SearchResult(
+                yield SearchResult(
                     id=self._generate_result_id(url),
                     url=url,
                     title=title,
@@ -72,13 +69,9 @@ class HaystakSearchEngine(BaseSearchEngine):
                     source_engine=self.engine_name,
                     query=query,
                     discovered_at=datetime.now(timezone.utc),
-                    raw_html=str(item),
+                    raw_html=str(item) if self._include_raw_html else None,
                 )
                 
-                results.append(result)
-                
             except Exception as e:
                 self._logger.warning(f"Failed to parse result: {e}")
                 continue
-        
-        return results
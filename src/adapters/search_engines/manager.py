@@ -1,9 +1,10 @@
 """Search engine manager for coordinating multiple engines."""
 
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+import asyncio
 import logging
 
 from .base import BaseSearchEngine, SearchEngineStatus
@@ -35,6 +36,45 @@ class SearchEngineManager:
         self._engines: Dict[str, BaseSearchEngine] = {}
         self._logger = logging.getLogger("robin.search.manager")
         self._engine_stats: Dict[str, Dict] = {}
+        # Shared by every search and health check, so worker threads are
+        # started once and reused rather than spawned per call
+        self._executor = self._create_executor()
+        # Pools set aside with searches that overran timeout_per_engine
+        self._retired: List[Tuple[ThreadPoolExecutor, Set[Future]]] = []
+    
+    def __enter__(self) -> "SearchEngineManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "SearchEngineManager":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    def _create_executor(self) -> ThreadPoolExecutor:
+        """Create a worker pool sized to config.max_workers."""
+        return ThreadPoolExecutor(
+            max_workers=self._config.max_workers,
+            thread_name_prefix="robin-search"
+        )
+    
+    def _retire_executor(self, pending: Set[Future]) -> None:
+        """
+        Swap in a fresh pool, leaving timed-out searches to finish on the old one.
+        
+        A running future can't be cancelled, so those searches would keep
+        holding shared workers and push later engines past their timeout.
+        """
+        retired, self._executor = self._executor, self._create_executor()
+        retired.shutdown(wait=False)
+        self._retired = [
+            (pool, futures) for pool, futures in self._retired
+            if not all(f.done() for f in futures)
+        ]
+        self._retired.append((retired, pending))
     
     def register_engine(self, engine: BaseSearchEngine) -> None:
         """Register a search engine."""
@@ -66,26 +106,25 @@ class SearchEngineManager:
         """Run health checks on all engines."""
         results = {}
         
-        with ThreadPoolExecutor(max_workers=self._config.max_workers) as executor:
-            future_to_engine = {
-                executor.submit(engine.health_check): name
-                for name, engine in self._engines.items()
-            }
-            
-            for future in as_completed(future_to_engine):
-                engine_name = future_to_engine[future]
-                try:
-                    is_healthy = future.result()
-                    engine = self._engines.get(engine_name)
-                    if engine:
-                        results[engine_name] = engine.get_status()
-                except Exception as e:
-                    results[engine_name] = SearchEngineStatus(
-                        engine_name=engine_name,
-                        is_available=False,
-                        last_check=datetime.now(),
-                        error_message=str(e)
-                    )
+        future_to_engine = {
+            self._executor.submit(engine.health_check): name
+            for name, engine in self._engines.items()
+        }
+        
+        for future in as_completed(future_to_engine):
+            engine_name = future_to_engine[future]
+            try:
+                is_healthy = future.result()
+                engine = self._engines.get(engine_name)
+                if engine:
+                    results[engine_name] = engine.get_status()
+            except Exception as e:
+                results[engine_name] = SearchEngineStatus(
+                    engine_name=engine_name,
+                    is_available=False,
+                    last_check=datetime.now(timezone.utc),
+                    error_message=str(e)
+                )
         
         return results
     
@@ -147,33 +186,118 @@ class SearchEngineManager:
                 return []
         
         # Execute searches in parallel
-        with ThreadPoolExecutor(max_workers=self._config.max_workers) as executor:
-            future_to_engine = {
-                executor.submit(search_engine, name): name
-                for name in target_engines
-            }
+        future_to_engine = {
+            self._executor.submit(search_engine, name): name
+            for name in target_engines
+        }
+        
+        # Give every engine the same budget and drop the ones that overrun it
+        done, not_done = wait(future_to_engine, timeout=self._config.timeout_per_engine)
+        
+        for future in not_done:
+            future.cancel()
+            self._logger.warning(f"Search timed out on {future_to_engine[future]}")
+        
+        running = {future for future in not_done if not future.cancelled()}
+        if running:
+            self._retire_executor(running)
+        
+        # Merge in submission order so results don't depend on timing
+        for future, engine_name in future_to_engine.items():
+            if future not in done:
+                continue
+            try:
+                self._merge_results(all_results, future.result(), seen_urls)
+                
+            except Exception as e:
+                self._logger.error(f"Failed to get results from {engine_name}: {e}")
+        
+        self._logger.info(f"Total results collected: {len(all_results)}")
+        
+        return all_results
+    
+    async def asearch(
+        self,
+        query: str,
+        engines: Optional[List[str]] = None,
+        max_results_per_engine: int = 50
+    ) -> List[SearchResult]:
+        """
+        Execute a search across multiple engines concurrently on the event loop.
+        
+        Engines create their async clients on first use; close them with
+        aclose() when done with this event loop.
+        
+        Args:
+            query: Search query
+            engines: Specific engines to use (all if None)
+            max_results_per_engine: Maximum results per engine
             
-            for future in as_completed(future_to_engine, timeout=self._config.timeout_per_engine):
-                engine_name = future_to_engine[future]
-                try:
-                    results = future.result()
-                    
-                    for result in results:
-                        # Deduplication
-                        if self._config.enable_deduplication:
-                            if result.url in seen_urls:
-                                continue
-                            seen_urls.add(result.url)
-                        
-                        all_results.append(result)
-                        
-                except Exception as e:
-                    self._logger.error(f"Failed to get results from {engine_name}: {e}")
+        Returns:
+            Combined and deduplicated results
+        """
+        target_engines = engines or list(self._engines.keys())
+        
+        # Filter to only registered engines
+        target_engines = [e for e in target_engines if e in self._engines]
+        
+        if not target_engines:
+            self._logger.warning("No valid engines available for search")
+            return []
+        
+        self._logger.info(f"Searching '{query}' across {len(target_engines)} engines")
+        
+        async def search_engine(engine_name: str) -> List[SearchResult]:
+            engine = self._engines[engine_name]
+            stats = self._engine_stats[engine_name]
+            try:
+                results = await asyncio.wait_for(
+                    engine.asearch(query, max_results_per_engine),
+                    timeout=self._config.timeout_per_engine
+                )
+                
+                # Update stats
+                stats["total_searches"] += 1
+                stats["successful_searches"] += 1
+                stats["total_results"] += len(results)
+                stats["last_search"] = datetime.now()
+                
+                return results
+            except Exception as e:
+                self._logger.error(f"Search failed on {engine_name}: {e}")
+                stats["total_searches"] += 1
+                return []
+        
+        engine_results = await asyncio.gather(
+            *[search_engine(name) for name in target_engines]
+        )
+        
+        all_results: List[SearchResult] = []
+        seen_urls: Set[str] = set()
+        
+        for results in engine_results:
+            self._merge_results(all_results, results, seen_urls)
         
         self._logger.info(f"Total results collected: {len(all_results)}")
         
         return all_results
     
+    def _merge_results(
+        self,
+        all_results: List[SearchResult],
+        results: List[SearchResult],
+        seen_urls: Set[str]
+    ) -> None:
+        """Append one engine's results, skipping URLs already seen if deduplicating."""
+        if not self._config.enable_deduplication:
+            all_results.extend(results)
+            return
+        
+        seen = seen_urls.__contains__
+        add = seen_urls.add
+        # add() returns None, so each new URL is recorded and kept
+        all_results.extend(r for r in results if not (seen(r.url) or add(r.url)))
+    
     def get_stats(self) -> Dict[str, Dict]:
         """Get statistics for all engines."""
         return self._engine_stats.copy()
@@ -182,3 +306,25 @@ class SearchEngineManager:
         """Set HTTP session for all engines."""
         for engine in self._engines.values():
             engine.set_session(session)
+    
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the worker threads.
+        
+        Args:
+            wait: Block until running searches and health checks finish,
+                including ones that timed out
+        """
+        self._executor.shutdown(wait=wait)
+        for executor, _ in self._retired:
+            executor.shutdown(wait=wait)
+        self._retired.clear()
+    
+    async def aclose(self) -> None:
+        """
+        Close the async clients the engines created for asearch().
+        
+        Call this (or use ``async with``) before the event loop that ran
+        the searches is closed.
+        """
+        await asyncio.gather(*(engine.aclose() for engine in self._engines.values()))
@@ -1,15 +1,31 @@
 """Torch search engine adapter."""
 
-from typing import List
-from urllib.parse import quote_plus
+from typing import Iterator, Optional, Tuple, Union
 from datetime import datetime, timezone
 
 from bs4 import BeautifulSoup
 
-from .base import BaseSearchEngine
+try:
+    # selectolax's C parser (lexbor) builds the tree far faster than bs4
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+from .base import BaseSearchEngine, HTML_PARSER, encode_query
 from ...core.entities.search_result import SearchResult
 
 
+# (url, title, text, raw_html) for one result container
+_Item = Tuple[str, str, str, Optional[str]]
+
+
+def _is_result_or_table(tag) -> bool:
+    """Match div.result result containers and fallback tables."""
+    if tag.name == "table":
+        return True
+    return tag.name == "div" and "result" in tag.get("class", ())
+
+
 class TorchSearchEngine(BaseSearchEngine):
     """
     Torch search engine adapter.
@@ -27,60 +43,96 @@ class TorchSearchEngine(BaseSearchEngine):
     
     def build_search_url(self, query: str) -> str:
         """Build the search URL for Torch."""
-        encoded_query = quote_plus(query)
+        encoded_query = encode_query(query)
         return f"{self.base_url}/cgi-bin/omega/omega?P={encoded_query}"
     
-    def _parse_results(self, html: str, query: str) -> List[SearchResult]:
+    def _parse_results(self, html: Union[str, bytes], query: str) -> Iterator[SearchResult]:
         """Parse Torch search results."""
-        results = []
+        if LexborHTMLParser is not None:
+            items = self._extract_items(html)
+        else:
+            items = self._extract_items_soup(html)
+        
+        for url, title, text_content, raw_html in items:
+            if not title:
+                title = "Untitled"
+            
+            # Drop the leading title from the description, keeping any
+            # later mentions of it
+            description = text_content.removeprefix(title).strip()
+            description = description[:500]  # Limit length
+            
+            yield SearchResult(
+                id=self._generate_result_id(url),
+                url=url,
+                title=title,
+                description=description,
+                source_engine=self.engine_name,
+                query=query,
+                discovered_at=datetime.now(timezone.utc),
+                raw_html=raw_html,
+            )
+    
+    def _extract_items(self, html: Union[str, bytes]) -> Iterator[_Item]:
+        """Extract result containers with selectolax."""
+        tree = LexborHTMLParser(html)
+        
+        # Find result containers, falling back to tables, in one pass
+        candidates = tree.css("div.result, table")
+        result_items = [node for node in candidates if node.tag == "div"]
+        if not result_items:
+            result_items = candidates
         
-        soup = BeautifulSoup(html, "html.parser")
+        skipped = 0
+        for item in result_items:
+            # Check the link before extracting any text
+            link = item.css_first("a")
+            url = link.attributes.get("href") if link is not None else None
+            if not url or not url.startswith("http"):
+                skipped += 1
+                continue
+            
+            # Separate the text nodes with NUL so that empty ones can be
+            # dropped, matching bs4's get_text(separator=" ", strip=True)
+            text_content = " ".join(
+                filter(None, item.text(separator="\0", strip=True).split("\0"))
+            )
+            
+            yield (
+                url,
+                link.text(strip=True),
+                text_content,
+                item.html if self._include_raw_html else None,
+            )
         
-        # Find result containers
-        result_items = soup.find_all("div", class_="result")
+        if skipped:
+            self._logger.debug(f"Skipped {skipped} containers without an absolute link")
+    
+    def _extract_items_soup(self, html: Union[str, bytes]) -> Iterator[_Item]:
+        """Extract result containers with BeautifulSoup."""
+        soup = BeautifulSoup(html, HTML_PARSER)
         
-        # Alternative selectors
+        # Find result containers, falling back to tables, in one pass
+        candidates = soup.find_all(_is_result_or_table)
+        result_items = [tag for tag in candidates if tag.name == "div"]
         if not result_items:
-            result_items = soup.find_all("table")
+            result_items = candidates
         
+        skipped = 0
         for item in result_items:
-            try:
-                # Extract URL
-                link = item.find("a")
-                if not link:
-                    continue
-                
-                url = link.get("href", "")
-                if not url or not url.startswith("http"):
-                    continue
-                
-                # Extract title
-                title = link.get_text(strip=True)
-                if not title:
-                    title = "Untitled"
-                
-                # Extract description
-                description = ""
-                text_content = item.get_text(separator=" ", strip=True)
-                # Remove title from description
-                description = text_content.replace(title, "").strip()
-                description = description[:500]  # Limit length
-                
-                result = SearchResult(
-                    id=self._generate_result_id(url),
-                    url=url,
-                    title=title,
-                    description=description,
-                    source_engine=self.engine_name,
-                    query=query,
-                    discovered_at=datetime.now(timezone.utc),
-                    raw_html=str(item),
-                )
-                
-                results.append(result)
-                
-            except Exception as e:
-                self._logger.warning(f"Failed to parse result: {e}")
+            # Check the link before extracting any text
+            link = item.find("a")
+            url = link.get("href") if link is not None else None
+            if not url or not url.startswith("http"):
+                skipped += 1
                 continue
+            
+            yield (
+                url,
+                link.get_text(strip=True),
+                item.get_text(separator=" ", strip=True),
+                str(item) if self._include_raw_html else None,
+            )
         
-        return results
+        if skipped:
+            self._logger.debug(f"Skipped {skipped} containers without an absolute link")
@@ -5,7 +5,38 @@ from datetime import datetime
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from ...core.interfaces.storage import StorageProvider
+from ...infrastructure.files import atomic_write
+
+
+# Bytes read from the start of a file to find its key
+KEY_HEAD_SIZE = 4096
+
+_decoder = json.JSONDecoder()
+
+
+def _safe_name(key: str) -> str:
+    """Sanitize a key to be a valid filename."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class JSONFileStorage(StorageProvider):
@@ -25,9 +56,7 @@ class JSONFileStorage(StorageProvider):
     
     def _get_file_path(self, key: str) -> Path:
         """Get file path for a key."""
-        # Sanitize key to be a valid filename
-        safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)
-        return self._base_path / f"{safe_key}.json"
+        return self._base_path / f"{_safe_name(key)}.json"
     
     def save(self, key: str, data: Any) -> bool:
         """Save data to a JSON file."""
@@ -40,8 +69,8 @@ class JSONFileStorage(StorageProvider):
                 "saved_at": datetime.now().isoformat(),
             }
             
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(wrapper, f, indent=2, default=str)
+            with atomic_write(file_path, fsync=True) as f:
+                f.write(_dumps(wrapper))
             
             return True
         except Exception:
@@ -55,8 +84,7 @@ class JSONFileStorage(StorageProvider):
             if not file_path.exists():
                 return None
             
-            with open(file_path, "r", encoding="utf-8") as f:
-                wrapper = json.load(f)
+            wrapper = _loads(file_path.read_bytes())
             
             return wrapper.get("data")
         except Exception:
@@ -78,15 +106,17 @@ class JSONFileStorage(StorageProvider):
         """List all keys (file names without extension)."""
         try:
             keys = []
+            # A file name starts with this if its key starts with prefix
+            name_prefix = _safe_name(prefix) if prefix else ""
             
             for file_path in self._base_path.glob("*.json"):
+                if not file_path.stem.startswith(name_prefix):
+                    continue
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        wrapper = json.load(f)
-                        key = wrapper.get("key", file_path.stem)
-                        
-                        if prefix is None or key.startswith(prefix):
-                            keys.append(key)
+                    key = self._read_key(file_path)
+                    
+                    if prefix is None or key.startswith(prefix):
+                        keys.append(key)
                 except Exception:
                     continue
             
@@ -94,6 +124,33 @@ class JSONFileStorage(StorageProvider):
         except Exception:
             return []
     
+    @staticmethod
+    def _read_key(file_path: Path) -> str:
+        """
+        Read a file's original key without parsing the whole file.
+        
+        save() writes the key first, so it is decoded from the start of
+        the file. Files that don't start that way are parsed in full.
+        """
+        with open(file_path, "rb") as f:
+            head = f.read(KEY_HEAD_SIZE).decode("utf-8", errors="ignore").lstrip()
+        
+        if head.startswith("{"):
+            head = head[1:].lstrip()
+            if head.startswith('"key"'):
+                head = head[len('"key"'):].lstrip()
+                if head.startswith(":"):
+                    try:
+                        key, _ = _decoder.raw_decode(head[1:].lstrip())
+                        if isinstance(key, str):
+                            return key
+                    except ValueError:
+                        # Key longer than the head; fall through
+                        pass
+        
+        wrapper = _loads(file_path.read_bytes())
+        return wrapper.get("key", file_path.stem)
+    
     def exists(self, key: str) -> bool:
         """Check if a key exists."""
         return self._get_file_path(key).exists()
@@ -13,6 +13,48 @@ from ...core.entities.search_result import SearchResult
 from ...core.entities.scraped_content import ScrapedContent
 
 
+# Applied to each thread's connection when it is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",       # 64 MiB
+    "PRAGMA mmap_size=268435456",     # 256 MiB
+    # INSERT OR REPLACE only fires the count triggers' DELETE side
+    # for the row it replaces with this on
+    "PRAGMA recursive_triggers=ON",
+)
+
+# Child tables and the investigations column that counts their rows
+_COUNTED_TABLES = (
+    ("search_results", "search_results_count"),
+    ("scraped_content", "scraped_pages_count"),
+    ("extracted_entities", "entities_count"),
+)
+
+# search_results.raw_html is no longer written; page HTML is kept in
+# search_results_raw when requested
+_INSERT_SEARCH_RESULT = """
+    INSERT OR REPLACE INTO search_results (
+        id, investigation_id, url, title, description,
+        source_engine, query, discovered_at, relevance_score,
+        is_scraped, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SEARCH_RESULT_RAW = """
+    INSERT OR REPLACE INTO search_results_raw (id, raw_html) VALUES (?, ?)
+"""
+
+_INSERT_SCRAPED_CONTENT = """
+    INSERT OR REPLACE INTO scraped_content (
+        id, search_result_id, investigation_id, url, title,
+        raw_html, clean_text, scraped_at, status_code,
+        content_type, content_length, language, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class SQLiteStorage(StorageProvider):
     """
     SQLite-based storage implementation.
@@ -34,8 +76,22 @@ class SQLiteStorage(StorageProvider):
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
             )
             self._local.connection.row_factory = sqlite3.Row
+            self._configure_connection(self._local.connection)
         return self._local.connection
     
+    @staticmethod
+    def _configure_connection(conn: sqlite3.Connection) -> None:
+        """
+        Tune a new connection for concurrent access.
+        
+        WAL lets readers run alongside a writer and only syncs on
+        checkpoints, which makes NORMAL synchronous safe against
+        corruption (a power loss can drop the latest commits). The page
+        cache and memory map keep hot pages out of the read() path.
+        """
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+    
     def initialize(self) -> None:
         """Initialize the database schema."""
         if self._initialized:
@@ -81,6 +137,16 @@ class SQLiteStorage(StorageProvider):
             )
         """)
         
+        # Raw HTML of search results, kept apart so the results table
+        # stays small and HTML is only written when asked for
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_results_raw (
+                id TEXT PRIMARY KEY,
+                raw_html TEXT,
+                FOREIGN KEY (id) REFERENCES search_results(id)
+            ) WITHOUT ROWID
+        """)
+        
         # Scraped content table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS scraped_content (
@@ -132,6 +198,35 @@ class SQLiteStorage(StorageProvider):
             )
         """)
         
+        # Keep the investigations' row counts up to date
+        for table, column in _COUNTED_TABLES:
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_count_insert
+                AFTER INSERT ON {table} WHEN NEW.investigation_id IS NOT NULL
+                BEGIN
+                    UPDATE investigations SET {column} = {column} + 1
+                    WHERE id = NEW.investigation_id;
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_count_delete
+                AFTER DELETE ON {table} WHEN OLD.investigation_id IS NOT NULL
+                BEGIN
+                    UPDATE investigations SET {column} = {column} - 1
+                    WHERE id = OLD.investigation_id;
+                END
+            """)
+        
+        # Drop a result's raw HTML with it, including when a re-save
+        # replaces the row, so HTML saved earlier doesn't outlive it
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_search_results_raw_delete
+            AFTER DELETE ON search_results
+            BEGIN
+                DELETE FROM search_results_raw WHERE id = OLD.id;
+            END
+        """)
+        
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_investigations_status ON investigations(status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_investigations_created ON investigations(created_at)")
@@ -219,31 +314,50 @@ class SQLiteStorage(StorageProvider):
     # Investigation-specific methods
     
     def save_investigation(self, investigation: Investigation) -> bool:
-        """Save an investigation."""
+        """
+        Save an investigation.
+        
+        The result counts are maintained by triggers on the child tables,
+        so an update leaves them alone. A new investigation starts from
+        the rows already saved for it.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
             cursor.execute("""
-                INSERT OR REPLACE INTO investigations (
+                INSERT INTO investigations (
                     id, query, status, created_at, updated_at, completed_at,
                     metadata, search_results_count, scraped_pages_count,
                     entities_count, summary, tags
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                investigation.id,
-                investigation.query,
-                investigation.status.value,
-                investigation.created_at,
-                investigation.updated_at,
-                investigation.completed_at,
-                json.dumps(investigation.metadata),
-                len(investigation.search_results),
-                len(investigation.scraped_content),
-                len(investigation.extracted_entities),
-                investigation.summary,
-                json.dumps(investigation.tags),
-            ))
+                ) VALUES (
+                    :id, :query, :status, :created_at, :updated_at, :completed_at,
+                    :metadata,
+                    (SELECT COUNT(*) FROM search_results WHERE investigation_id = :id),
+                    (SELECT COUNT(*) FROM scraped_content WHERE investigation_id = :id),
+                    (SELECT COUNT(*) FROM extracted_entities WHERE investigation_id = :id),
+                    :summary, :tags
+                )
+                ON CONFLICT(id) DO UPDATE SET
+                    query = excluded.query,
+                    status = excluded.status,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    completed_at = excluded.completed_at,
+                    metadata = excluded.metadata,
+                    summary = excluded.summary,
+                    tags = excluded.tags
+            """, {
+                "id": investigation.id,
+                "query": investigation.query,
+                "status": investigation.status.value,
+                "created_at": investigation.created_at,
+                "updated_at": investigation.updated_at,
+                "completed_at": investigation.completed_at,
+                "metadata": json.dumps(investigation.metadata),
+                "summary": investigation.summary,
+                "tags": json.dumps(investigation.tags),
+            })
             conn.commit()
             return True
         except Exception as e:
@@ -326,38 +440,83 @@ class SQLiteStorage(StorageProvider):
     def save_search_result(
         self,
         result: SearchResult,
-        investigation_id: Optional[str] = None
+        investigation_id: Optional[str] = None,
+        store_raw: bool = False
     ) -> bool:
-        """Save a search result."""
+        """
+        Save a search result.
+        
+        The result's raw_html is only stored if store_raw is set; see
+        load_raw_html(). Re-saving a result replaces any raw HTML stored
+        for it before.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO search_results (
-                    id, investigation_id, url, title, description,
-                    source_engine, query, discovered_at, relevance_score,
-                    is_scraped, raw_html, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                result.id,
-                investigation_id,
-                result.url,
-                result.title,
-                result.description,
-                result.source_engine,
-                result.query,
-                result.discovered_at,
-                result.relevance_score,
-                1 if result.is_scraped else 0,
-                result.raw_html,
-                json.dumps(result.metadata),
-            ))
+            cursor.execute(
+                _INSERT_SEARCH_RESULT,
+                self._rows_for_search_result(result, investigation_id)
+            )
+            if store_raw and result.raw_html:
+                cursor.execute(_INSERT_SEARCH_RESULT_RAW, (result.id, result.raw_html))
             conn.commit()
             return True
         except Exception:
             return False
     
+    def save_search_results_bulk(
+        self,
+        results: List[SearchResult],
+        investigation_id: Optional[str] = None,
+        store_raw: bool = False
+    ) -> bool:
+        """
+        Save many search results in a single transaction.
+        
+        Much faster than calling save_search_result() per result, which
+        commits (and syncs the database file) once per row. Either all
+        of the results are saved or none are.
+        """
+        conn = self._get_connection()
+        
+        try:
+            rows = [self._rows_for_search_result(r, investigation_id) for r in results]
+            with conn:
+                conn.executemany(_INSERT_SEARCH_RESULT, rows)
+                if store_raw:
+                    conn.executemany(
+                        _INSERT_SEARCH_RESULT_RAW,
+                        [(r.id, r.raw_html) for r in results if r.raw_html]
+                    )
+            return True
+        except Exception:
+            return False
+    
+    def load_raw_html(self, result_id: str) -> Optional[str]:
+        """Load the raw HTML stored for a search result, if any."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(
+                "SELECT raw_html FROM search_results_raw WHERE id = ?",
+                (result_id,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+            
+            # Databases written before the split kept it inline
+            cursor.execute(
+                "SELECT raw_html FROM search_results WHERE id = ?",
+                (result_id,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+        except Exception:
+            return None
+    
     def save_scraped_content(
         self,
         content: ScrapedContent,
@@ -368,32 +527,77 @@ class SQLiteStorage(StorageProvider):
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO scraped_content (
-                    id, search_result_id, investigation_id, url, title,
-                    raw_html, clean_text, scraped_at, status_code,
-                    content_type, content_length, language, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                content.id,
-                content.search_result_id,
-                investigation_id,
-                content.url,
-                content.title,
-                content.raw_html,
-                content.clean_text,
-                content.scraped_at,
-                content.status_code,
-                content.content_type,
-                content.content_length,
-                content.language,
-                json.dumps(content.metadata),
-            ))
+            cursor.execute(
+                _INSERT_SCRAPED_CONTENT,
+                self._rows_for_scraped_content(content, investigation_id)
+            )
             conn.commit()
             return True
         except Exception:
             return False
     
+    def save_scraped_contents_bulk(
+        self,
+        contents: List[ScrapedContent],
+        investigation_id: Optional[str] = None
+    ) -> bool:
+        """
+        Save many scraped pages in a single transaction.
+        
+        See save_search_results_bulk().
+        """
+        conn = self._get_connection()
+        
+        try:
+            rows = [self._rows_for_scraped_content(c, investigation_id) for c in contents]
+            with conn:
+                conn.executemany(_INSERT_SCRAPED_CONTENT, rows)
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _rows_for_search_result(
+        result: SearchResult,
+        investigation_id: Optional[str]
+    ) -> tuple:
+        """Build the search_results row for a result."""
+        return (
+            result.id,
+            investigation_id,
+            result.url,
+            result.title,
+            result.description,
+            result.source_engine,
+            result.query,
+            result.discovered_at,
+            result.relevance_score,
+            1 if result.is_scraped else 0,
+            json.dumps(result.metadata),
+        )
+    
+    @staticmethod
+    def _rows_for_scraped_content(
+        content: ScrapedContent,
+        investigation_id: Optional[str]
+    ) -> tuple:
+        """Build the scraped_content row for a page."""
+        return (
+            content.id,
+            content.search_result_id,
+            investigation_id,
+            content.url,
+            content.title,
+            content.raw_html,
+            content.clean_text,
+            content.scraped_at,
+            content.status_code,
+            content.content_type,
+            content.content_length,
+            content.language,
+            json.dumps(content.metadata),
+        )
+    
     def search_full_text(self, query: str, table: str = "search_results") -> List[Dict]:
         """Perform full-text search."""
         conn = self._get_connection()
@@ -420,25 +624,32 @@ class SQLiteStorage(StorageProvider):
         stats = {}
         
         try:
-            cursor.execute("SELECT COUNT(*) FROM investigations")
-            stats["total_investigations"] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM search_results")
-            stats["total_search_results"] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM scraped_content")
-            stats["total_scraped_pages"] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM extracted_entities")
-            stats["total_entities"] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM search_history")
-            stats["total_searches"] = cursor.fetchone()[0]
+            # One statement, so the counts come back in a single step
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM investigations),
+                    (SELECT COUNT(*) FROM search_results),
+                    (SELECT COUNT(*) FROM scraped_content),
+                    (SELECT COUNT(*) FROM extracted_entities),
+                    (SELECT COUNT(*) FROM search_history)
+            """)
+            (
+                stats["total_investigations"],
+                stats["total_search_results"],
+                stats["total_scraped_pages"],
+                stats["total_entities"],
+                stats["total_searches"],
+            ) = cursor.fetchone()
             
-            # Database file size
+            # Database file size, including commits still in the
+            # write-ahead log waiting for a checkpoint
             db_file = Path(self._db_path)
             if db_file.exists():
-                stats["database_size_bytes"] = db_file.stat().st_size
+                size = db_file.stat().st_size
+                wal_file = db_file.with_name(db_file.name + "-wal")
+                if wal_file.exists():
+                    size += wal_file.stat().st_size
+                stats["database_size_bytes"] = size
             
         except Exception:
             pass
@@ -446,7 +657,16 @@ class SQLiteStorage(StorageProvider):
         return stats
     
     def close(self) -> None:
-        """Close the database connection."""
+        """
+        Close the database connection.
+        
+        Checkpoints the write-ahead log first, so the database file is
+        complete on its own and the -wal file is truncated.
+        """
         if hasattr(self._local, 'connection') and self._local.connection:
+            try:
+                self._local.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
             self._local.connection.close()
             self._local.connection = None
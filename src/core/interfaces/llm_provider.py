@@ -5,7 +5,7 @@ from typing import Optional, List, Dict, Any, Callable, AsyncIterator
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM provider."""
     content: str
@@ -21,7 +21,7 @@ class LLMResponse:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """Configuration for LLM providers."""
     model_name: str
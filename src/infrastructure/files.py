@@ -0,0 +1,56 @@
+"""File writing helpers shared by the exporters and storage adapters."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+import os
+import tempfile
+
+
+# Coalesce many small writes into few large write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Process umask, read once since it can only be queried by changing it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(
+    path: Union[str, Path],
+    mode: str = "wb",
+    fsync: bool = False
+) -> Iterator[BinaryIO]:
+    """
+    Open a file for writing that only replaces ``path`` once complete.
+    
+    Data goes to a uniquely named sibling ``.tmp`` file through a large
+    write buffer and is renamed over the destination when the block
+    exits cleanly, so a failed write never leaves a half-written file
+    behind and concurrent writes of the same path don't collide.
+    
+    Args:
+        path: Destination file path
+        mode: File mode for the temporary file
+        fsync: Flush the data to disk before the rename
+        
+    Yields:
+        The open temporary file
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        # mkstemp makes the file private; give it the usual permissions
+        os.chmod(tmp_name, 0o666 & ~_UMASK)
+        with os.fdopen(fd, mode, buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,92 @@
+"""Tests for shared export helpers."""
+
+import io
+import json
+import os
+
+import pytest
+
+from src.adapters.export.base import dumps_json, write_json_document
+from src.infrastructure.files import atomic_write
+
+
+DOCUMENT = {
+    "investigation": {"id": "inv1", "tags": ["a", "b"], "summary": "line\nbreak"},
+    "results": [{"id": "r1", "score": 0.5}, {"id": "r2", "nested": {"x": [1, 2]}}],
+    "empty": [],
+    "version": "1.0",
+}
+
+
+def _stream(indent):
+    """Stream DOCUMENT with its lists passed as iterators."""
+    buffer = io.BytesIO()
+    members = [
+        (key, iter(value) if isinstance(value, list) else value)
+        for key, value in DOCUMENT.items()
+    ]
+    write_json_document(buffer, members, indent)
+    return buffer.getvalue()
+
+
+class TestJSONHelpers:
+    """Tests for dumps_json and write_json_document."""
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_streamed_document_matches_dumps(self, indent):
+        """Test that streaming produces the same bytes as one dumps call."""
+        assert _stream(indent) == dumps_json(DOCUMENT, indent)
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_streamed_document_is_valid_json(self, indent):
+        """Test that streamed output round-trips."""
+        assert json.loads(_stream(indent)) == DOCUMENT
+
+    def test_dumps_unknown_types_as_str(self):
+        """Test that unsupported values fall back to str."""
+        assert json.loads(dumps_json({"value": {1}})) == {"value": "{1}"}
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write."""
+
+    def test_replaces_destination_on_success(self, temp_dir):
+        """Test that the destination gets the new content and no temp file remains."""
+        path = os.path.join(temp_dir, "out.json")
+        with open(path, "wb") as f:
+            f.write(b"old")
+
+        with atomic_write(path) as f:
+            f.write(b"new")
+
+        with open(path, "rb") as f:
+            assert f.read() == b"new"
+        assert os.listdir(temp_dir) == ["out.json"]
+
+    def test_keeps_destination_on_failure(self, temp_dir):
+        """Test that a failed write leaves the previous file untouched."""
+        path = os.path.join(temp_dir, "out.json")
+        with open(path, "wb") as f:
+            f.write(b"old")
+
+        with pytest.raises(RuntimeError):
+            with atomic_write(path) as f:
+                f.write(b"partial")
+                raise RuntimeError("export failed")
+
+        with open(path, "rb") as f:
+            assert f.read() == b"old"
+        assert os.listdir(temp_dir) == ["out.json"]
+
+    def test_overlapping_writes_use_separate_temp_files(self, temp_dir):
+        """Test that two writes of the same path in progress don't clobber each other."""
+        path = os.path.join(temp_dir, "out.json")
+
+        with atomic_write(path) as first:
+            with atomic_write(path) as second:
+                first.write(b"first")
+                second.write(b"second")
+
+        with open(path, "rb") as f:
+            assert f.read() == b"first"
+        assert os.listdir(temp_dir) == ["out.json"]
@@ -0,0 +1,245 @@
+"""Tests for the shared LLM provider behaviour."""
+
+import asyncio
+
+import pytest
+
+from src.adapters.llm.base import BaseLLMProvider
+from src.adapters.llm.stream_buffer import StreamBuffer
+from src.core.interfaces.llm_provider import LLMConfig, LLMResponse
+from src.infrastructure.cache.memory import MemoryCache
+
+
+class EchoProvider(BaseLLMProvider):
+    """Provider that echoes prompts and counts API calls."""
+    
+    SUPPORTED_MODELS = ["echo"]
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+    
+    @property
+    def provider_name(self):
+        return "echo"
+    
+    @property
+    def supported_models(self):
+        return self.SUPPORTED_MODELS
+    
+    def initialize(self):
+        pass
+    
+    def _complete(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        return LLMResponse(content=prompt.upper(), model=self.config.model_name)
+    
+    async def _acomplete(self, prompt, system_prompt=None, **kwargs):
+        return self._complete(prompt, system_prompt, **kwargs)
+    
+    def stream(self, prompt, system_prompt=None, callback=None, **kwargs):
+        return self._complete(prompt).content
+    
+    async def astream(self, prompt, system_prompt=None, **kwargs):
+        yield self._complete(prompt).content
+    
+    def _create_langchain_llm(self):
+        return None
+
+
+class TestBaseLLMProvider:
+    """Tests for BaseLLMProvider."""
+    
+    @pytest.fixture
+    def provider(self):
+        """Create a provider with an in-memory response cache."""
+        return EchoProvider(LLMConfig(model_name="echo"), cache=MemoryCache())
+    
+    def test_deterministic_completion_cached(self, provider):
+        """Test that repeated temperature 0 prompts hit the cache."""
+        first = provider.complete("hello")
+        second = provider.complete("hello")
+        
+        assert provider.calls == 1
+        assert second.content == first.content == "HELLO"
+        assert second.metadata["cached"] is True
+    
+    def test_cache_key_includes_request(self, provider):
+        """Test that different prompts and options are cached separately."""
+        provider.complete("hello")
+        provider.complete("hello", system_prompt="Be brief")
+        provider.complete("hello", max_tokens=5)
+        provider.complete("other")
+        
+        assert provider.calls == 4
+    
+    def test_sampled_completion_not_cached(self, provider):
+        """Test that non-zero temperature requests always call the API."""
+        provider.complete("hello", temperature=0.7)
+        provider.complete("hello", temperature=0.7)
+        
+        assert provider.calls == 2
+    
+    def test_async_completion_shares_cache(self, provider):
+        """Test that acomplete reads and writes the same cache."""
+        provider.complete("hello")
+        response = asyncio.run(provider.acomplete("hello"))
+        
+        assert provider.calls == 1
+        assert response.content == "HELLO"
+    
+    def test_no_cache_by_default(self):
+        """Test that providers without a cache always call the API."""
+        provider = EchoProvider(LLMConfig(model_name="echo"))
+        provider.complete("hello")
+        provider.complete("hello")
+        
+        assert provider.calls == 2
+    
+    def test_validate_model(self, provider):
+        """Test that model validation ignores case."""
+        assert provider.validate_model("echo")
+        assert provider.validate_model("ECHO")
+        assert not provider.validate_model("other")
+    
+    def test_health_check_result_reused(self):
+        """Test that health checks within the TTL don't call the API."""
+        provider = EchoProvider(LLMConfig(model_name="echo"))
+        
+        assert provider.health_check() is True
+        assert provider.health_check() is True
+        assert provider.calls == 1
+    
+    def test_health_check_bypasses_response_cache(self, provider):
+        """Test that an expired health check calls the API despite a cached reply."""
+        assert provider.health_check() is True
+        provider._health_checked_until = 0.0
+        assert provider.health_check() is True
+    
+        assert provider.calls == 2
+    
+    def test_async_context_closes_client(self, provider):
+        """Test that leaving the async context closes the async client."""
+        class FakeAsyncClient:
+            closed = False
+            
+            async def close(self):
+                self.closed = True
+        
+        client = FakeAsyncClient()
+        provider._async_client = client
+        
+        async def use_provider():
+            async with provider as p:
+                await p.acomplete("hello")
+        
+        asyncio.run(use_provider())
+        
+        assert client.closed
+        assert provider._async_client is None
+    
+    def test_estimate_tokens(self, provider):
+        """Test that token estimates work with or without tiktoken."""
+        assert provider.estimate_tokens("") == 0
+        assert provider.estimate_tokens("hello world, " * 10) > 0
+        assert provider.estimate_tokens("<|endoftext|>") > 0
+    
+    def test_batch_complete_preserves_order(self, provider):
+        """Test that batched responses match the order of the prompts."""
+        prompts = [f"prompt {i}" for i in range(25)]
+        responses = provider.batch_complete(prompts, max_concurrency=4)
+        
+        assert [r.content for r in responses] == [p.upper() for p in prompts]
+        assert provider.batch_complete([]) == []
+    
+    def test_abatch_complete_preserves_order(self, provider):
+        """Test that async batched responses match the order of the prompts."""
+        prompts = [f"prompt {i}" for i in range(25)]
+        responses = asyncio.run(provider.abatch_complete(prompts, max_concurrency=4))
+        
+        assert [r.content for r in responses] == [p.upper() for p in prompts]
+    
+    def test_langchain_llm_shared_between_equal_configs(self):
+        """Test that providers with the same config share a LangChain LLM."""
+        class FakeLLM:
+            pass
+        
+        class LangChainEchoProvider(EchoProvider):
+            def _create_langchain_llm(self):
+                return FakeLLM()
+        
+        first = LangChainEchoProvider(LLMConfig(model_name="echo"))
+        second = LangChainEchoProvider(LLMConfig(model_name="echo"))
+        other = LangChainEchoProvider(LLMConfig(model_name="echo", temperature=0.5))
+        
+        assert first.get_langchain_llm() is second.get_langchain_llm()
+        assert other.get_langchain_llm() is not first.get_langchain_llm()
+
+
+class TestGoogleProvider:
+    """Tests for GoogleProvider."""
+    
+    def test_aclose_closes_async_session(self):
+        """Test that aclose() closes the Gemini client's aio session."""
+        pytest.importorskip("google.genai")
+        from src.adapters.llm.google import GoogleProvider
+        
+        class FakeAio:
+            closed = False
+            
+            async def aclose(self):
+                self.closed = True
+        
+        aio = FakeAio()
+        provider = GoogleProvider(LLMConfig(model_name="gemini-flash-latest"))
+        provider._client = type("FakeClient", (), {"aio": aio})()
+        
+        asyncio.run(provider.aclose())
+        
+        assert aio.closed
+        assert provider._client is None
+
+
+class TestStreamBuffer:
+    """Tests for StreamBuffer."""
+    
+    def test_coalesces_small_chunks(self):
+        """Test that chunks are batched until flushed."""
+        received = []
+        buffer = StreamBuffer(received.append, max_interval=60)
+        
+        for chunk in ["a", "b", "c"]:
+            buffer.push(chunk)
+        assert received == []
+        
+        buffer.flush()
+        assert received == ["abc"]
+    
+    def test_flushes_when_size_reached(self):
+        """Test that a full buffer is flushed immediately."""
+        received = []
+        buffer = StreamBuffer(received.append, max_chars=4, max_interval=60)
+        
+        buffer.push("ab")
+        buffer.push("cd")
+        buffer.push("e")
+        buffer.flush()
+        
+        assert received == ["abcd", "e"]
+    
+    def test_flushes_when_interval_elapsed(self):
+        """Test that buffered text is not held back longer than the interval."""
+        received = []
+        buffer = StreamBuffer(received.append, max_interval=0)
+        
+        buffer.push("a")
+        buffer.push("b")
+        
+        assert received == ["a", "b"]
+    
+    def test_flush_without_text_is_noop(self):
+        """Test that flushing an empty buffer doesn't call the callback."""
+        received = []
+        StreamBuffer(received.append).flush()
+        
+        assert received == []
@@ -0,0 +1,161 @@
+"""Tests for plugin loading and management."""
+
+import json
+import os
+import sys
+import textwrap
+
+import pytest
+
+from plugins.loader import PluginManager, MANIFEST_NAME
+
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    from . import base
+
+
+    class WordCountAnalyzer(base.AnalyzerPlugin):
+        """Counts words in content."""
+
+        @classmethod
+        def metadata(cls):
+            return base.PluginMetadata(
+                name="word_count",
+                version="1.0.0",
+                description="Counts words",
+                author="Tests",
+                plugin_type="analyzer",
+                config_schema={"min_length": {"type": "integer", "required": True}},
+            )
+
+        @property
+        def analyzer_name(self):
+            return "word_count"
+
+        def initialize(self, config):
+            self.config = config
+
+        def shutdown(self):
+            pass
+
+        def analyze(self, content, options=None):
+            return {"words": len(content.split())}
+
+
+    Plugin = WordCountAnalyzer
+''')
+
+
+class TestPluginManager:
+    """Tests for PluginManager."""
+
+    @pytest.fixture
+    def plugins_dir(self, temp_dir):
+        """Create a plugins directory with a single plugin."""
+        with open(os.path.join(temp_dir, "word_count.py"), "w") as f:
+            f.write(PLUGIN_SOURCE)
+        yield temp_dir
+        sys.modules.pop("plugins.word_count", None)
+
+    def test_load_all_writes_manifest(self, plugins_dir):
+        """Test that loading plugins persists their metadata."""
+        manager = PluginManager(plugins_dir)
+
+        assert manager.load_all() == 1
+
+        with open(os.path.join(plugins_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+
+        entries = list(manifest["plugins"].values())
+        assert len(entries) == 1
+        assert entries[0]["metadata"]["name"] == "word_count"
+
+    def test_cached_plugin_not_imported_until_initialized(self, plugins_dir):
+        """Test that unchanged plugins are registered from the manifest."""
+        PluginManager(plugins_dir).load_all()
+        sys.modules.pop("plugins.word_count", None)
+
+        manager = PluginManager(plugins_dir)
+        assert manager.load_all() == 1
+        assert "plugins.word_count" not in sys.modules
+        assert [m.name for m in manager.list_plugins()] == ["word_count"]
+
+        plugin = manager.initialize_plugin("word_count", {"min_length": 1})
+        assert plugin is not None
+        assert plugin.analyze("one two three") == {"words": 3}
+
+    def test_changed_plugin_is_reimported(self, plugins_dir):
+        """Test that editing a plugin invalidates its manifest entry."""
+        PluginManager(plugins_dir).load_all()
+
+        with open(os.path.join(plugins_dir, "word_count.py"), "a") as f:
+            f.write("\n# changed\n")
+        sys.modules.pop("plugins.word_count", None)
+
+        manager = PluginManager(plugins_dir)
+        assert manager.load_all() == 1
+        assert "plugins.word_count" in sys.modules
+
+    @pytest.mark.parametrize("bad_entry", [
+        None,
+        ["not", "a", "dict"],
+        {},
+        {"metadata": {"name": "word_count"}},
+        {"metadata": "word_count"},
+    ])
+    def test_bad_manifest_entry_reimports_plugin(self, plugins_dir, bad_entry):
+        """Test that a damaged manifest entry is treated as a cache miss."""
+        PluginManager(plugins_dir).load_all()
+        manifest_path = os.path.join(plugins_dir, MANIFEST_NAME)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        for path, entry in manifest["plugins"].items():
+            if bad_entry is None or isinstance(bad_entry, list):
+                manifest["plugins"][path] = bad_entry
+            else:
+                manifest["plugins"][path] = {"signature": entry["signature"], **bad_entry}
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+        sys.modules.pop("plugins.word_count", None)
+
+        manager = PluginManager(plugins_dir)
+        assert manager.load_all() == 1
+        assert [m.name for m in manager.list_plugins()] == ["word_count"]
+
+    def test_invalid_config_rejected(self, plugins_dir):
+        """Test that configs are validated against the plugin schema."""
+        pytest.importorskip("jsonschema")
+        manager = PluginManager(plugins_dir)
+        manager.load_all()
+
+        assert manager.initialize_plugin("word_count", {"min_length": "x"}) is None
+        assert manager.initialize_plugin("word_count", {}) is None
+        assert manager.initialize_plugin("word_count", {"min_length": 3}) is not None
+
+    def test_malformed_config_schema_rejected(self, plugins_dir):
+        """Test that a plugin with an invalid config schema fails to initialize."""
+        pytest.importorskip("jsonschema")
+        with open(os.path.join(plugins_dir, "word_count.py"), "w") as f:
+            f.write(PLUGIN_SOURCE.replace(
+                '{"min_length": {"type": "integer", "required": True}}',
+                '{"x": {"type": "nope"}}',
+            ))
+        manager = PluginManager(plugins_dir)
+        manager.load_all()
+
+        assert manager.initialize_plugin("word_count", {"x": 1}) is None
+        assert manager.get_plugin("word_count") is None
+
+    def test_get_plugins_by_type(self, plugins_dir):
+        """Test looking up initialized plugins by type."""
+        manager = PluginManager(plugins_dir)
+        manager.load_all()
+
+        assert manager.get_plugins_by_type("analyzer") == []
+
+        plugin = manager.initialize_plugin("word_count", {"min_length": 1})
+        assert manager.get_plugins_by_type("analyzer") == [plugin]
+        assert manager.get_plugins_by_type("search_engine") == []
+
+        assert manager.shutdown_plugin("word_count") is True
+        assert manager.get_plugins_by_type("analyzer") == []
@@ -0,0 +1,97 @@
+"""Tests for search engine result parsing."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.adapters.search_engines import ahmia
+from src.adapters.search_engines.ahmia import AhmiaSearchEngine
+
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is fixed, so undated results compare equal."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+def _item(i):
+    return (
+        f'<li class="result">\n  <h4>\n'
+        f'    <a href="/search/redirect?q=x&amp;redirect_url=http://x{i}.onion/p%20q">\n'
+        f'  Title {i} &amp; <b>more</b>&nbsp;</a>\n  </h4>\n'
+        f'  <p>Desc <b>{i}</b>  text é &lt;x&gt;</p>\n  <cite>x{i}.onion</cite>\n'
+        f'  <span class="updated">2024-01-0{i % 9 + 1}</span>\n</li>\n'
+    )
+
+
+# (page, whether the fast parser should handle it)
+AHMIA_PAGES = {
+    "results": (
+        "<html><head><meta charset='utf-8'></head><body><ol>"
+        + "".join(_item(i) for i in range(12))
+        + "</ol></body></html>",
+        True,
+    ),
+    "no_date": (
+        "<ol>" + "".join(f'<li class="result"><a href="http://a{i}">A</a></li>' for i in range(3)) + "</ol>",
+        True,
+    ),
+    "no_link": ('<ol><li class="result"><p>no link</p></li><li class="result"><a href="u"></a><p></p></li></ol>', True),
+    "bad_date": ('<ol><li class="result"><a href="u">t</a><span class="updated">yesterday</span></li></ol>', True),
+    "doctype": ('<!DOCTYPE html><HTML><ol><li class="result"><a href="u">t</a><p>d</p></li></ol>', True),
+    "extra_class": ('<ol><li class="result other"><a href="u">t</a></li></ol>', False),
+    "comment": ('<ol><li class="result"><a href="u">t<!-- x --></a></li></ol>', False),
+    "no_results": ("<html><body>No results</body></html>", False),
+    "block_in_p": ('<ol><li class="result"><a href="u">t</a><p>x<div>y</div></p></li></ol>', False),
+    "upper_case": ('<ol><li class="result"><A HREF="http://u">t</A><P>desc</P></li></ol>', False),
+    "textarea": ('<li class="result"><a href="u">T</a><textarea><p>x</p></textarea><p>d</p></li>', False),
+    "script": ('<li class="result"><a href="u">T</a><script>"<p>x</p>"</script><p>d</p></li>', False),
+    "unclosed": ('<ol><li class="result"><a href="u">t</a><p>d</ol>', False),
+}
+
+
+class TestAhmiaParser:
+    """Tests for the Ahmia result parsers."""
+    
+    @pytest.fixture
+    def engine(self, monkeypatch):
+        """Create an engine whose results are the keyword arguments it passes to SearchResult."""
+        monkeypatch.setattr(ahmia, "SearchResult", lambda **fields: fields)
+        monkeypatch.setattr(ahmia, "datetime", FrozenDatetime)
+        return AhmiaSearchEngine()
+    
+    @pytest.mark.parametrize("as_bytes", [False, True])
+    @pytest.mark.parametrize("name", sorted(AHMIA_PAGES))
+    def test_fast_parser_matches_soup(self, engine, name, as_bytes):
+        """Test that the fast parser gives the soup's results or falls back to it."""
+        html, handled = AHMIA_PAGES[name]
+        if as_bytes:
+            html = html.encode("utf-8")
+        
+        fast = engine._parse_results_fast(html, "query")
+        soup = list(engine._parse_results_soup(html, "query"))
+        
+        assert (fast is not None) == handled
+        if handled:
+            assert fast == soup
+        assert list(engine._parse_results(html, "query")) == soup
+    
+    def test_fast_parser_stops_at_max_results(self, engine):
+        """Test that collecting results stops after max_results items."""
+        html = AHMIA_PAGES["results"][0]
+        
+        results = engine._collect_results(html, "query", 3)
+        
+        assert results == list(engine._parse_results_soup(html, "query"))[:3]
+    
+    def test_non_utf8_bytes_fall_back(self, engine):
+        """Test that pages the fast parser can't decode go to the soup."""
+        html = '<ol><li class="result"><a href="u">café</a></li></ol>'.encode("latin-1")
+        
+        assert engine._parse_results_fast(html, "query") is None
+        assert len(list(engine._parse_results(html, "query"))) == 1
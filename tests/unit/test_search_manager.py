@@ -0,0 +1,75 @@
+"""Tests for the search engine manager."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.adapters.search_engines.manager import SearchEngineManager, SearchManagerConfig
+
+
+class FakeEngine:
+    """Engine that returns fixed URLs after a delay."""
+    
+    def __init__(self, engine_name, urls, delay=0.0, release=None):
+        self.engine_name = engine_name
+        self.urls = urls
+        self.delay = delay
+        self.release = release
+        self.finished = False
+    
+    def search(self, query, max_results=50):
+        if self.release is not None:
+            self.release.wait()
+        time.sleep(self.delay)
+        self.finished = True
+        return [SimpleNamespace(url=url) for url in self.urls]
+
+
+class TestSearchEngineManager:
+    """Tests for SearchEngineManager."""
+    
+    @pytest.fixture
+    def release(self):
+        """Event that lets the slow engine finish."""
+        event = threading.Event()
+        yield event
+        event.set()
+    
+    @pytest.fixture
+    def manager(self, release):
+        """Create a manager with two fast engines and one that hangs."""
+        manager = SearchEngineManager(SearchManagerConfig(max_workers=4, timeout_per_engine=1))
+        manager.register_engine(FakeEngine("first", ["a", "b"], delay=0.2))
+        manager.register_engine(FakeEngine("slow", ["s"], delay=0.2, release=release))
+        manager.register_engine(FakeEngine("second", ["b", "c"]))
+        yield manager
+        manager.close(wait=False)
+    
+    def test_timed_out_engine_dropped(self, manager):
+        """Test that a slow engine is dropped and the others' results merged in order."""
+        results = manager.search("query")
+        
+        assert [r.url for r in results] == ["a", "b", "c"]
+        assert not manager.get_engine("slow").finished
+        assert manager.get_stats()["slow"]["total_searches"] == 0
+    
+    def test_timed_out_engine_does_not_hold_workers(self, manager):
+        """Test that searches after a timeout still get the full pool."""
+        manager.search("query")
+        
+        # Without a fresh pool the hung searches would fill all four workers
+        for _ in range(3):
+            assert [r.url for r in manager.search("query")] == ["a", "b", "c"]
+        
+        assert manager.get_stats()["first"]["successful_searches"] == 4
+    
+    def test_close_waits_for_timed_out_searches(self, manager, release):
+        """Test that close() waits for searches that overran their timeout."""
+        manager.search("query")
+        
+        release.set()
+        manager.close()
+        
+        assert manager.get_engine("slow").finished
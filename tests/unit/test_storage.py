@@ -0,0 +1,157 @@
+"""Tests for the SQLite storage adapter."""
+
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.adapters.storage.sqlite import SQLiteStorage
+from src.core.entities.investigation import InvestigationStatus
+
+
+class ResultStorage(SQLiteStorage):
+    """SQLiteStorage with the generic StorageProvider methods filled in."""
+    
+    get = list = count = update = None
+
+
+def make_investigation(investigation_id):
+    """Build an object with the fields save_investigation() stores."""
+    now = datetime.now()
+    return SimpleNamespace(
+        id=investigation_id,
+        query="query",
+        status=InvestigationStatus.PENDING,
+        created_at=now,
+        updated_at=now,
+        completed_at=None,
+        metadata={},
+        summary=None,
+        tags=[],
+    )
+
+
+def make_result(result_id, raw_html=None):
+    """Build an object with the fields save_search_result() stores."""
+    return SimpleNamespace(
+        id=result_id,
+        url=f"http://{result_id}.onion",
+        title=result_id,
+        description="",
+        source_engine="test",
+        query="query",
+        discovered_at=datetime.now(),
+        relevance_score=0.0,
+        is_scraped=False,
+        metadata={},
+        raw_html=raw_html,
+    )
+
+
+class TestSQLiteStorage:
+    """Tests for SQLiteStorage."""
+    
+    @pytest.fixture
+    def storage(self, temp_dir):
+        """Create a storage instance with two investigations."""
+        storage = ResultStorage(db_path=os.path.join(temp_dir, "robin.db"))
+        storage.initialize()
+        storage.save_investigation(make_investigation("inv1"))
+        storage.save_investigation(make_investigation("inv2"))
+        yield storage
+        storage.close()
+    
+    def result_count(self, storage, investigation_id):
+        """Read an investigation's stored search result count."""
+        row = storage._get_connection().execute(
+            "SELECT search_results_count FROM investigations WHERE id = ?",
+            (investigation_id,)
+        ).fetchone()
+        return row[0]
+    
+    def test_saving_results_counts_them(self, storage):
+        """Test that saved results are counted on their investigation."""
+        storage.save_search_result(make_result("r1"), "inv1")
+        storage.save_search_results_bulk([make_result("r2"), make_result("r3")], "inv1")
+        
+        assert self.result_count(storage, "inv1") == 3
+        assert self.result_count(storage, "inv2") == 0
+    
+    def test_resaving_results_keeps_count(self, storage):
+        """Test that replacing existing results doesn't count them twice."""
+        results = [make_result("r1"), make_result("r2")]
+        storage.save_search_results_bulk(results, "inv1")
+        storage.save_search_results_bulk(results, "inv1")
+        storage.save_search_result(results[0], "inv1")
+        
+        assert self.result_count(storage, "inv1") == 2
+    
+    def test_moving_result_updates_both_counts(self, storage):
+        """Test that saving a result under another investigation moves its count."""
+        storage.save_search_results_bulk([make_result("r1"), make_result("r2")], "inv1")
+        storage.save_search_result(make_result("r1"), "inv2")
+        
+        assert self.result_count(storage, "inv1") == 1
+        assert self.result_count(storage, "inv2") == 1
+    
+    def test_resaving_investigation_keeps_count(self, storage):
+        """Test that updating an investigation leaves its counts alone."""
+        storage.save_search_results_bulk([make_result("r1"), make_result("r2")], "inv1")
+        storage.save_investigation(make_investigation("inv1"))
+        
+        assert self.result_count(storage, "inv1") == 2
+    
+    def test_new_investigation_counts_existing_results(self, storage):
+        """Test that an investigation saved after its results starts from their count."""
+        storage.save_search_results_bulk([make_result("r1"), make_result("r2")], "inv3")
+        storage.save_investigation(make_investigation("inv3"))
+        
+        assert self.result_count(storage, "inv3") == 2
+    
+    def test_raw_html_only_stored_when_requested(self, storage):
+        """Test that raw HTML goes to search_results_raw only with store_raw."""
+        storage.save_search_result(make_result("r1", "<li>one</li>"), "inv1")
+        storage.save_search_result(make_result("r2", "<li>two</li>"), "inv1", store_raw=True)
+        storage.save_search_results_bulk(
+            [make_result("r3", "<li>three</li>"), make_result("r4")], "inv1", store_raw=True
+        )
+        
+        assert storage.load_raw_html("r1") is None
+        assert storage.load_raw_html("r2") == "<li>two</li>"
+        assert storage.load_raw_html("r3") == "<li>three</li>"
+        assert storage.load_raw_html("r4") is None
+        row = storage._get_connection().execute(
+            "SELECT COUNT(*) FROM search_results WHERE raw_html IS NOT NULL"
+        ).fetchone()
+        assert row[0] == 0
+    
+    def test_resaving_without_raw_html_drops_it(self, storage):
+        """Test that a re-save without store_raw doesn't leave stale raw HTML."""
+        storage.save_search_result(make_result("r1", "<li>old</li>"), "inv1", store_raw=True)
+        storage.save_search_results_bulk([make_result("r1", "<li>old</li>")], "inv1")
+        
+        assert storage.load_raw_html("r1") is None
+        
+        storage.save_search_result(make_result("r1", "<li>new</li>"), "inv1", store_raw=True)
+        
+        assert storage.load_raw_html("r1") == "<li>new</li>"
+    
+    def test_raw_html_falls_back_to_inline_column(self, storage):
+        """Test that raw HTML written inline by older versions is still loaded."""
+        storage.save_search_result(make_result("r1"), "inv1")
+        conn = storage._get_connection()
+        conn.execute("UPDATE search_results SET raw_html = ? WHERE id = ?", ("<li>legacy</li>", "r1"))
+        conn.commit()
+        
+        assert storage.load_raw_html("r1") == "<li>legacy</li>"
+        assert storage.load_raw_html("missing") is None
+    
+    def test_database_size_includes_wal(self, storage, temp_dir):
+        """Test that the reported size counts commits not yet checkpointed."""
+        storage.save_search_results_bulk([make_result(f"r{i}") for i in range(50)], "inv1")
+        db_path = os.path.join(temp_dir, "robin.db")
+        wal_size = os.path.getsize(db_path + "-wal")
+        
+        assert wal_size > 0
+        assert storage.get_statistics()["database_size_bytes"] == os.path.getsize(db_path) + wal_size